@@ -17,12 +17,22 @@ Usage:
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve
+from lxml import etree, html as lxml_html
 import pymysql
 import argparse
 import time
 import re
 import logging
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from urllib.parse import urljoin, urlparse
 from typing import Dict, List, Optional, Any
 from datetime import datetime
@@ -30,22 +40,85 @@ import os
 from dotenv import load_dotenv
 
 
+# Chapter number in chapter URLs
+_CHAPTER_NUM_RE = re.compile(r'chapter-(\d+)')
+
+# Multi-row chapter INSERTs, kept below MySQL's default 4 MB max_allowed_packet.
+# A chapter stored since the existence check is left as is instead of failing
+# the whole batch on the unique key.
+_CHAPTER_INSERT_SQL = (
+    "INSERT INTO chapters (novel_id, chapter_number, title, content, word_count, created_at, updated_at) VALUES "
+)
+_CHAPTER_ROW_PLACEHOLDER = "(%s, %s, %s, %s, %s, NOW(), NOW())"
+_CHAPTER_INSERT_SUFFIX = " ON DUPLICATE KEY UPDATE id = id"
+_MAX_INSERT_BYTES = 4 * 1024 * 1024 - 64 * 1024
+
+# Novel page fields, evaluated by libxml2 instead of per-node Python callbacks
+_TITLE_XPATH = etree.XPath(
+    'normalize-space(//h1[contains(concat(" ", normalize-space(@class), " "), " story__identity-title ")])'
+)
+_AUTHOR_XPATH = etree.XPath('normalize-space(//h3[contains(text(), "Author:")])')
+_DESCRIPTION_XPATH = etree.XPath(
+    'normalize-space(//h3[normalize-space(text())="Description"]/following-sibling::p[1])'
+)
+_COVER_XPATH = etree.XPath('string(//img[contains(@alt, "Cover of")]/@src)')
+_CHAPTER_LINK_COUNT_XPATH = etree.XPath('count(//a[contains(@href, "chapter-")])')
+_STATUS_SPAN_XPATH = etree.XPath(
+    'normalize-space(//span[contains(concat(" ", normalize-space(@class), " "), " status ")])'
+)
+_STATUS_DIV_XPATH = etree.XPath(
+    'normalize-space(//div[contains(concat(" ", normalize-space(@class), " "), " story__status ")])'
+)
+
+# Chapter page selectors, compiled once instead of re-parsing class lists per call
+_CHAPTER_TITLE_SELECTOR = soupsieve.compile('h1.chapter__title')
+_CHAPTER_CONTENT_SELECTOR = soupsieve.compile('div.chapter-formatting')
+_NEXT_BUTTON_SELECTOR = soupsieve.compile('a.button._secondary._navigation._next')
+# Page chrome that can sit inside the content div and must not end up in the chapter text
+_UNWANTED_CONTENT_SELECTOR = soupsieve.compile('script, style, nav, footer, header')
+
+# Chapter pages only need the title, the content div and the next button
+_CHAPTER_STRAINER = SoupStrainer(
+    ['h1', 'div', 'a'],
+    attrs={'class': ['chapter__title', 'chapter-formatting', 'button _secondary _navigation _next']}
+)
+
+
 class DivineDaoLibraryScraper:
-    def __init__(self):
+    def __init__(self, concurrency: int = 10, requests_per_second: float = 5.0, bulk: bool = False):
         """Initialize the scraper with Divine Dao Library configuration."""
         self.base_url = "https://www.divinedaolibrary.com"
+        self.concurrency = max(1, concurrency)
+        self.bulk = bulk
+        # Shared request pacing; the interval widens when the server throttles us
+        self._min_interval = 1.0 / requests_per_second
+        self._interval = self._min_interval
+        self._next_allowed = 0.0
+        self._rate_lock = threading.Lock()
         self.session = requests.Session()
         self.session.headers.update({
             "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.5",
-            "Accept-Encoding": "gzip, deflate",
+            "Accept-Encoding": ACCEPT_ENCODING,  # includes br when brotli is installed
             "Connection": "keep-alive",
             "Upgrade-Insecure-Requests": "1"
         })
+        # Retries with exponential backoff happen in urllib3; the pool is sized for concurrent batches
+        retry = Retry(total=3, backoff_factor=1.0, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=max(20, self.concurrency), max_retries=retry)
+        self.session.mount('https://', adapter)
         load_dotenv()
         self.setup_logging()
         self.db_connection = None
+        self.cursor = None
+        self.chapter_batch_size = 100
+        self._chapter_buffer: List[tuple] = []
+        # Chapters and words actually committed by flush_chapters during the current scrape
+        self._saved_chapters = 0
+        self._saved_words = 0
+        self._existing_chapters: set = set()
+        self._not_found_urls: set = set()
         
     def setup_logging(self):
         """Setup logging configuration."""
@@ -69,36 +142,101 @@ class DivineDaoLibraryScraper:
                 database=os.getenv('DB_NAME', 'novel_db'),
                 charset=os.getenv('DB_CHARSET', 'utf8mb4')
             )
+            # One cursor is shared by every query for the rest of the run
+            self.cursor = self.db_connection.cursor()
             self.logger.info("Database connection established")
         except pymysql.Error as e:
             self.logger.error(f"Database connection error: {e}")
             raise
     
-    def fetch_page(self, url: str, retries: int = 3) -> Optional[BeautifulSoup]:
-        """Fetch and parse a web page with retry logic."""
-        for attempt in range(retries + 1):
-            try:
-                self.logger.info(f"Fetching: {url} (attempt {attempt + 1})")
-                response = self.session.get(url, timeout=30)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                return soup
-                
-            except requests.RequestException as e:
-                self.logger.warning(f"Request failed (attempt {attempt + 1}): {e}")
-                if attempt < retries:
-                    time.sleep(5 * (attempt + 1))  # Exponential backoff
-                else:
-                    self.logger.error(f"Failed to fetch {url} after {retries + 1} attempts")
-                    return None
+    def wait_for_request_slot(self):
+        """Block until the rate limiter allows another request."""
+        with self._rate_lock:
+            now = time.monotonic()
+            delay = max(0.0, self._next_allowed - now)
+            self._next_allowed = max(now, self._next_allowed) + self._interval
+        if delay:
+            time.sleep(delay)
+    
+    def adjust_request_rate(self, throttled: bool):
+        """Double the request interval when throttled, otherwise ease back towards the target rate."""
+        with self._rate_lock:
+            if throttled:
+                self._interval = min(self._interval * 2, 30.0)
+                self.logger.warning(f"Server is throttling requests, interval raised to {self._interval:.2f}s")
+            elif self._interval > self._min_interval:
+                self._interval = max(self._min_interval, self._interval * 0.9)
+    
+    def fetch_response(self, url: str, stream: bool = False) -> Optional[requests.Response]:
+        """Fetch a URL through the rate limiter; retries and backoff are handled by the session adapter."""
+        try:
+            self.wait_for_request_slot()
+            self.logger.info(f"Fetching: {url}")
+            response = self.session.get(url, timeout=30, stream=stream)
+            
+            # urllib3 records any 429/503 responses it retried through
+            retries = getattr(response.raw, 'retries', None)
+            self.adjust_request_rate(bool(retries) and any(
+                attempt.status in (429, 503) for attempt in retries.history
+            ))
+            if response.status_code == 404:
+                self._not_found_urls.add(url)
+            response.raise_for_status()
+            return response
+            
+        except requests.exceptions.RetryError as e:
+            self.adjust_request_rate(True)
+            self.logger.error(f"Failed to fetch {url}: {e}")
+            return None
+        except requests.RequestException as e:
+            self.logger.error(f"Failed to fetch {url}: {e}")
+            return None
+    
+    def url_not_found(self, url: str) -> bool:
+        """Check with a HEAD request whether a URL returns 404, without downloading the page."""
+        if url in self._not_found_urls:
+            return True
+        try:
+            self.wait_for_request_slot()
+            response = self.session.head(url, allow_redirects=True, timeout=10)
+        except requests.RequestException as e:
+            self.logger.warning(f"HEAD probe failed for {url}: {e}")
+            return False
+        if response.status_code == 404:
+            self._not_found_urls.add(url)
+            return True
+        return False
+    
+    def fetch_page(self, url: str, strainer: Optional[SoupStrainer] = None) -> Optional[BeautifulSoup]:
+        """Fetch and parse a web page, optionally parsing only strained tags."""
+        response = self.fetch_response(url)
+        if response is None:
+            return None
+        return BeautifulSoup(response.content, 'lxml', parse_only=strainer)
+    
+    def fetch_tree(self, url: str) -> Optional[lxml_html.HtmlElement]:
+        """Fetch a web page and parse it into an lxml element tree straight from the socket."""
+        response = self.fetch_response(url, stream=True)
+        if response is None:
+            return None
+        try:
+            # lxml reads the decoded body incrementally, so no full bytes copy is kept.
+            # A charset from the Content-Type header wins over lxml's latin-1 default.
+            encoding = response.encoding if 'charset=' in response.headers.get('Content-Type', '').lower() else None
+            response.raw.decode_content = True
+            return lxml_html.parse(response.raw, parser=lxml_html.HTMLParser(encoding=encoding)).getroot()
+        except (Urllib3HTTPError, etree.ParserError) as e:
+            self.logger.error(f"Failed to read {url}: {e}")
+            return None
+        finally:
+            response.close()
     
     def scrape_novel_info(self, novel_slug: str) -> Optional[Dict[str, Any]]:
         """Scrape novel information from the novel's main page."""
         novel_url = f"{self.base_url}/story/{novel_slug}"
-        soup = self.fetch_page(novel_url)
+        tree = self.fetch_tree(novel_url)
         
-        if not soup:
+        if tree is None:
             return None
         
         novel_info = {
@@ -113,35 +251,23 @@ class DivineDaoLibraryScraper:
         
         try:
             # Extract title
-            title_element = soup.find('h1', class_='story__identity-title')
-            if title_element:
-                novel_info['title'] = title_element.get_text(strip=True)
+            novel_info['title'] = _TITLE_XPATH(tree) or None
             
-            # Extract author - look for the h3 element containing "Author:"
-            author_element = soup.find('h3', string=lambda text: text and 'Author:' in text)
-            if author_element:
-                author_text = author_element.get_text(strip=True)
+            # Extract author - the h3 element containing "Author:"
+            author_text = _AUTHOR_XPATH(tree)
+            if author_text:
                 # Extract author name from "Author: 莫默 (MOMO)" format
                 if ':' in author_text:
                     novel_info['author'] = author_text.split(':', 1)[1].strip()
                 else:
                     novel_info['author'] = author_text.strip()
             
-            # Extract description - look for content after "Description" h3
-            desc_heading = soup.find('h3', string='Description')
-            if desc_heading:
-                # Find the next p tag that contains description text
-                current = desc_heading.next_sibling
-                while current:
-                    if hasattr(current, 'name') and current.name == 'p':
-                        novel_info['description'] = current.get_text(strip=True)
-                        break
-                    current = current.next_sibling
+            # Extract description - the first p after the "Description" h3
+            novel_info['description'] = _DESCRIPTION_XPATH(tree) or None
             
             # Extract cover image
-            cover_element = soup.find('img', alt=lambda x: x and 'Cover of' in x)
-            if cover_element and cover_element.get('src'):
-                cover_url = cover_element.get('src')
+            cover_url = _COVER_XPATH(tree)
+            if cover_url:
                 if cover_url.startswith('//'):
                     cover_url = 'https:' + cover_url
                 elif cover_url.startswith('/'):
@@ -149,17 +275,14 @@ class DivineDaoLibraryScraper:
                 novel_info['cover_image'] = cover_url
             
             # Extract total chapters from chapter list
-            chapter_links = soup.find_all('a', href=lambda x: x and 'chapter-' in x)
-            novel_info['total_chapters'] = len(chapter_links)
+            novel_info['total_chapters'] = int(_CHAPTER_LINK_COUNT_XPATH(tree))
             
             # Try to determine status
-            status_element = soup.find('span', class_='status') or soup.find('div', class_='story__status')
-            if status_element:
-                status_text = status_element.get_text(strip=True).lower()
-                if 'completed' in status_text or 'finished' in status_text:
-                    novel_info['status'] = 'completed'
-                elif 'hiatus' in status_text or 'paused' in status_text:
-                    novel_info['status'] = 'hiatus'
+            status_text = (_STATUS_SPAN_XPATH(tree) or _STATUS_DIV_XPATH(tree)).lower()
+            if 'completed' in status_text or 'finished' in status_text:
+                novel_info['status'] = 'completed'
+            elif 'hiatus' in status_text or 'paused' in status_text:
+                novel_info['status'] = 'hiatus'
             
             self.logger.info(f"Novel info extracted: {novel_info['title']} by {novel_info['author']}")
             return novel_info
@@ -170,19 +293,17 @@ class DivineDaoLibraryScraper:
     
     def get_or_create_novel(self, novel_info: Dict[str, Any]) -> Optional[int]:
         """Get or create novel in database and return novel_id."""
-        cursor = self.db_connection.cursor()
-        
         try:
             # Check if novel exists by slug
-            cursor.execute("SELECT id FROM novels WHERE slug = %s", (novel_info['slug'],))
-            result = cursor.fetchone()
+            self.cursor.execute("SELECT id FROM novels WHERE slug = %s", (novel_info['slug'],))
+            result = self.cursor.fetchone()
             
             if result:
                 novel_id = result[0]
                 self.logger.info(f"Found existing novel with ID: {novel_id}")
                 
                 # Update the novel with new information
-                cursor.execute("""
+                self.cursor.execute("""
                     UPDATE novels SET 
                         title = %s, author = %s, description = %s, cover_image = %s, 
                         total_chapters = %s, status = %s, updated_at = NOW()
@@ -196,7 +317,7 @@ class DivineDaoLibraryScraper:
                 self.logger.info(f"Updated existing novel: {novel_info['title']}")
             else:
                 # Create new novel
-                cursor.execute("""
+                self.cursor.execute("""
                     INSERT INTO novels (title, slug, author, description, cover_image, 
                                       total_chapters, status, created_at, updated_at) 
                     VALUES (%s, %s, %s, %s, %s, %s, %s, NOW(), NOW())
@@ -206,7 +327,7 @@ class DivineDaoLibraryScraper:
                     novel_info['total_chapters'], novel_info['status']
                 ))
                 self.db_connection.commit()
-                novel_id = cursor.lastrowid
+                novel_id = self.cursor.lastrowid
                 self.logger.info(f"Created new novel with ID: {novel_id}")
             
             return novel_id
@@ -214,47 +335,46 @@ class DivineDaoLibraryScraper:
         except pymysql.Error as e:
             self.logger.error(f"Database error managing novel: {e}")
             return None
-        finally:
-            cursor.close()
+    
+    def chapter_url_prefix(self, novel_slug: str) -> str:
+        """Build the part of a chapter URL that precedes the chapter number."""
+        return f"{self.base_url}/story/{novel_slug}/{novel_slug}-chapter-"
     
     def build_chapter_url(self, novel_slug: str, chapter_number: int) -> str:
         """Build chapter URL from pattern."""
-        return f"{self.base_url}/story/{novel_slug}/{novel_slug}-chapter-{chapter_number}"
+        return self.chapter_url_prefix(novel_slug) + str(chapter_number)
     
-    def extract_chapter_data(self, soup: BeautifulSoup, chapter_number: int) -> Optional[Dict[str, Any]]:
-        """Extract chapter data from parsed HTML."""
+    def extract_chapter_data(self, soup: BeautifulSoup, chapter_number: int,
+                             content_element: Optional[Any] = None) -> Optional[Dict[str, Any]]:
+        """Extract chapter data from parsed HTML, reusing content_element when already located."""
         try:
             chapter_data = {
                 'chapter_number': chapter_number,
                 'title': None,
-                'content': None
+                'content': None,
+                'word_count': 0
             }
             
             # Extract title
-            title_element = soup.find('h1', class_='chapter__title')
+            title_element = _CHAPTER_TITLE_SELECTOR.select_one(soup)
             if title_element:
                 chapter_data['title'] = title_element.get_text(strip=True)
             
             # Extract content
-            content_element = soup.find('div', class_='chapter-formatting')
+            if content_element is None:
+                content_element = _CHAPTER_CONTENT_SELECTOR.select_one(soup)
             if content_element:
                 # Remove unwanted elements
-                for unwanted in content_element.find_all(['script', 'style', 'nav', 'footer', 'header']):
+                for unwanted in _UNWANTED_CONTENT_SELECTOR.select(content_element):
                     unwanted.decompose()
                 
-                # Convert br tags to line breaks
-                for br in content_element.find_all('br'):
-                    br.replace_with('\n')
+                # Join the text nodes in one walk; a single str.split() pass then
+                # collapses every whitespace run, line breaks included
+                content = ' '.join(' '.join(content_element.stripped_strings).split())
                 
-                # Get text with preserved paragraphs
-                content = content_element.get_text(separator='\n')
-                
-                # Clean text
-                content = re.sub(r'\s+', ' ', content)  # Normalize whitespace
-                content = re.sub(r'\n\s*\n+', '\n\n', content)  # Normalize line breaks
-                content = re.sub(r'^\s+|\s+$', '', content, flags=re.MULTILINE)  # Strip line whitespace
-                
-                chapter_data['content'] = content.strip()
+                chapter_data['content'] = content
+                # Words are separated by exactly one space after the collapse above
+                chapter_data['word_count'] = content.count(' ') + 1 if content else 0
             
             if not chapter_data['content']:
                 self.logger.warning(f"No content found for chapter {chapter_number}")
@@ -270,7 +390,7 @@ class DivineDaoLibraryScraper:
         """Extract the next chapter URL from the current page."""
         try:
             # Look for next chapter button
-            next_element = soup.find('a', class_='button _secondary _navigation _next')
+            next_element = _NEXT_BUTTON_SELECTOR.select_one(soup)
             if next_element and next_element.get('href'):
                 next_url = next_element.get('href')
                 if next_url.startswith('/'):
@@ -281,147 +401,229 @@ class DivineDaoLibraryScraper:
             self.logger.error(f"Error finding next chapter URL: {e}")
             return None
     
-    def chapter_exists_in_db(self, novel_id: int, chapter_number: int) -> bool:
-        """Check if chapter already exists in database."""
-        cursor = self.db_connection.cursor()
+    def set_bulk_load_mode(self, enabled: bool):
+        """Toggle session-level constraint checks off for bulk chapter loads, or back on."""
+        value = 0 if enabled else 1
         try:
-            cursor.execute(
-                "SELECT id FROM chapters WHERE novel_id = %s AND chapter_number = %s",
-                (novel_id, chapter_number)
-            )
-            return cursor.fetchone() is not None
+            self.cursor.execute(f"SET SESSION unique_checks = {value}")
+            self.cursor.execute(f"SET SESSION foreign_key_checks = {value}")
+            self.logger.info(f"Bulk load mode {'enabled' if enabled else 'disabled'}")
         except pymysql.Error as e:
-            self.logger.error(f"Database error checking chapter existence: {e}")
-            return False
-        finally:
-            cursor.close()
+            self.logger.warning(f"Could not change bulk load session settings: {e}")
+    
+    def get_existing_chapter_numbers(self, novel_id: int) -> set:
+        """Load the chapter numbers already stored for a novel in one query."""
+        try:
+            self.cursor.execute("SELECT chapter_number FROM chapters WHERE novel_id = %s", (novel_id,))
+            return {row[0] for row in self.cursor.fetchall()}
+        except pymysql.Error as e:
+            self.logger.error(f"Database error loading existing chapters: {e}")
+            return set()
     
     def save_chapter(self, novel_id: int, chapter_data: Dict[str, Any]) -> bool:
-        """Save chapter to database."""
-        cursor = self.db_connection.cursor()
+        """Buffer a chapter for insertion, flushing once the buffer is full."""
+        word_count = chapter_data.get('word_count', 0)
+        
+        self._chapter_buffer.append((
+            novel_id,
+            chapter_data['chapter_number'],
+            chapter_data.get('title', ''),
+            chapter_data.get('content', ''),
+            word_count
+        ))
+        self.logger.info(f"Chapter {chapter_data['chapter_number']} queued - {word_count} words")
+        
+        if len(self._chapter_buffer) >= self.chapter_batch_size:
+            return self.flush_chapters()
+        return True
+    
+    def split_rows_by_size(self, rows: List[tuple]) -> List[List[tuple]]:
+        """Group chapter rows so each INSERT statement stays under max_allowed_packet."""
+        groups = []
+        current = []
+        current_size = 0
+        for row in rows:
+            row_size = len(row[3].encode('utf-8')) + len((row[2] or '').encode('utf-8'))
+            if current and current_size + row_size > _MAX_INSERT_BYTES:
+                groups.append(current)
+                current = []
+                current_size = 0
+            current.append(row)
+            current_size += row_size
+        if current:
+            groups.append(current)
+        return groups
+    
+    def flush_chapters(self) -> bool:
+        """Insert all buffered chapters in a single transaction; they stay buffered if it fails."""
+        if not self._chapter_buffer:
+            return True
+        
         try:
-            # Calculate word count
-            content = chapter_data.get('content', '')
-            word_count = len(content.split()) if content else 0
-            
-            cursor.execute(
-                """INSERT INTO chapters (novel_id, chapter_number, title, content, word_count, created_at, updated_at) 
-                   VALUES (%s, %s, %s, %s, %s, NOW(), NOW())""",
-                (
-                    novel_id,
-                    chapter_data['chapter_number'],
-                    chapter_data.get('title', ''),
-                    content,
-                    word_count
+            # One multi-row INSERT per packet-sized group of chapters
+            for rows in self.split_rows_by_size(self._chapter_buffer):
+                self.cursor.execute(
+                    _CHAPTER_INSERT_SQL + ", ".join([_CHAPTER_ROW_PLACEHOLDER] * len(rows)) + _CHAPTER_INSERT_SUFFIX,
+                    [value for row in rows for value in row]
                 )
-            )
             self.db_connection.commit()
-            
-            self.logger.info(f"Chapter {chapter_data['chapter_number']} saved - {word_count} words")
-            return True
         except pymysql.Error as e:
-            self.logger.error(f"Database error saving chapter {chapter_data['chapter_number']}: {e}")
+            self.db_connection.rollback()
+            first, last = self._chapter_buffer[0][1], self._chapter_buffer[-1][1]
+            self.logger.error(f"Database error saving chapters {first}-{last}, "
+                              f"keeping them for the next attempt: {e}")
             return False
-        finally:
-            cursor.close()
+        
+        self._existing_chapters.update(row[1] for row in self._chapter_buffer)
+        self._saved_chapters += len(self._chapter_buffer)
+        self._saved_words += sum(row[4] for row in self._chapter_buffer)
+        self.logger.info(f"Saved {len(self._chapter_buffer)} chapters to database")
+        self._chapter_buffer.clear()
+        return True
+    
+    def fetch_chapter_batch(self, executor: ThreadPoolExecutor, urls: List[str]) -> List[Optional[BeautifulSoup]]:
+        """Fetch a batch of chapter pages concurrently, preserving URL order."""
+        return list(executor.map(partial(self.fetch_page, strainer=_CHAPTER_STRAINER), urls))
     
     def scrape_chapters(self, novel_slug: str, novel_id: int, start_chapter: int = 1, 
                        end_chapter: Optional[int] = None, skip_existing: bool = True):
-        """Scrape chapters using next button navigation."""
-        self.logger.info(f"Starting chapter scraping from chapter {start_chapter}")
+        """Scrape chapters in concurrently fetched batches of predictable chapter URLs."""
+        self.logger.info(f"Starting chapter scraping from chapter {start_chapter} "
+                         f"({self.concurrency} concurrent requests)")
         
-        # Build first chapter URL
-        current_url = self.build_chapter_url(novel_slug, start_chapter)
+        url_prefix = self.chapter_url_prefix(novel_slug)
         chapter_number = start_chapter
         consecutive_failures = 0
         max_consecutive_failures = 5
-        chapters_scraped = 0
-        total_words = 0
+        # Only chapters committed to the database count as scraped
+        self._saved_chapters = 0
+        self._saved_words = 0
+        pages_requested = 0
+        pattern_misses = 0
+        previous_soup = None
+        previous_url = None
+        previous_number = None
+        last_attempted = None  # Highest chapter actually processed; batches are fetched ahead of it
+        stop = False
         
-        while current_url and (not end_chapter or chapter_number <= end_chapter):
-            try:
-                # Check if chapter already exists
-                if skip_existing and self.chapter_exists_in_db(novel_id, chapter_number):
-                    self.logger.info(f"Chapter {chapter_number} already exists, skipping")
-                    chapter_number += 1
-                    current_url = self.build_chapter_url(novel_slug, chapter_number)
-                    continue
-                
-                # Fetch chapter page
-                soup = self.fetch_page(current_url)
-                if not soup:
-                    consecutive_failures += 1
-                    if consecutive_failures >= max_consecutive_failures:
-                        self.logger.error(f"Too many consecutive failures, stopping")
-                        break
-                    chapter_number += 1
-                    current_url = self.build_chapter_url(novel_slug, chapter_number)
-                    continue
-                
-                # Check if chapter exists on the page
-                if not soup.find('div', class_='chapter-formatting'):
-                    self.logger.warning(f"Chapter {chapter_number} not found on page")
-                    consecutive_failures += 1
-                    if consecutive_failures >= max_consecutive_failures:
-                        self.logger.error(f"Too many consecutive failures, stopping")
-                        break
+        # Load existing chapter numbers once instead of querying per chapter
+        if skip_existing:
+            self._existing_chapters = self.get_existing_chapter_numbers(novel_id)
+            self.logger.info(f"{len(self._existing_chapters)} chapters already in database")
+            
+            # Jump past the leading run of stored chapters without iterating through it
+            first_missing = next(n for n in itertools.count(start_chapter) if n not in self._existing_chapters)
+            if first_missing > start_chapter:
+                self.logger.info(f"Chapters {start_chapter}-{first_missing - 1} already exist, "
+                                 f"starting at chapter {first_missing}")
+                chapter_number = first_missing
+        
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            while not stop and (not end_chapter or chapter_number <= end_chapter):
+                # Collect the next batch of chapters, skipping ones already stored
+                batch = []
+                while len(batch) < self.concurrency and (not end_chapter or chapter_number <= end_chapter):
+                    if skip_existing and chapter_number in self._existing_chapters:
+                        self.logger.info(f"Chapter {chapter_number} already exists, skipping")
+                    else:
+                        batch.append(chapter_number)
                     chapter_number += 1
-                    current_url = self.build_chapter_url(novel_slug, chapter_number)
-                    continue
                 
-                # Extract chapter data
-                chapter_data = self.extract_chapter_data(soup, chapter_number)
-                if not chapter_data:
-                    consecutive_failures += 1
-                    if consecutive_failures >= max_consecutive_failures:
-                        break
-                    chapter_number += 1
-                    current_url = self.build_chapter_url(novel_slug, chapter_number)
+                if not batch:
                     continue
                 
-                # Save chapter
-                if self.save_chapter(novel_id, chapter_data):
-                    chapters_scraped += 1
-                    word_count = len(chapter_data.get('content', '').split())
-                    total_words += word_count
-                    consecutive_failures = 0  # Reset failure counter
-                    
-                    # Log progress every 10 chapters
-                    if chapters_scraped % 10 == 0:
-                        self.logger.info(f"Progress: {chapters_scraped} chapters scraped, {total_words:,} words")
-                else:
-                    consecutive_failures += 1
-                
-                # Get next chapter URL from navigation or build it
-                next_url = self.get_next_chapter_url(soup, current_url)
-                if next_url:
-                    current_url = next_url
-                    # Extract chapter number from URL
-                    match = re.search(r'chapter-(\d+)', next_url)
-                    if match:
-                        chapter_number = int(match.group(1))
-                    else:
-                        chapter_number += 1
-                else:
-                    # Try building next chapter URL
-                    chapter_number += 1
-                    current_url = self.build_chapter_url(novel_slug, chapter_number)
-                
-                # Delay between requests
-                time.sleep(1.0)
+                # Fetch the whole batch concurrently; DB writes below stay serialized
+                urls = [url_prefix + str(number) for number in batch]
+                pages = self.fetch_chapter_batch(executor, urls)
+                pages_requested += len(urls)
                 
-            except Exception as e:
-                self.logger.error(f"Error processing chapter {chapter_number}: {e}")
-                consecutive_failures += 1
-                if consecutive_failures >= max_consecutive_failures:
-                    break
-                chapter_number += 1
-                current_url = self.build_chapter_url(novel_slug, chapter_number)
+                for number, url, soup in zip(batch, urls, pages):
+                    last_attempted = number
+                    try:
+                        # Only parse the previous page's navigation when the URL pattern 404s
+                        if not soup and url in self._not_found_urls:
+                            pattern_misses += 1
+                            if previous_soup is not None and previous_number == number - 1:
+                                next_url = self.get_next_chapter_url(previous_soup, previous_url)
+                                match = _CHAPTER_NUM_RE.search(next_url) if next_url else None
+                                if next_url and next_url != url and match and int(match.group(1)) == number:
+                                    self.logger.info(f"Chapter {number} not at {url}, following next button to {next_url}")
+                                    url = next_url
+                                    soup = self.fetch_page(url, strainer=_CHAPTER_STRAINER)
+                                    pages_requested += 1
+                        
+                        if not soup:
+                            consecutive_failures += 1
+                            if consecutive_failures >= max_consecutive_failures:
+                                self.logger.error(f"Too many consecutive failures, stopping")
+                                stop = True
+                                break
+                            continue
+                        
+                        # Check if chapter exists on the page
+                        content_element = _CHAPTER_CONTENT_SELECTOR.select_one(soup)
+                        if not content_element:
+                            self.logger.warning(f"Chapter {number} not found on page")
+                            
+                            # A 404 on the following chapter means we've reached the end of the novel
+                            if self.url_not_found(url_prefix + str(number + 1)):
+                                self.logger.info(f"Chapter {number + 1} does not exist, reached end of novel")
+                                stop = True
+                                break
+                            consecutive_failures += 1
+                            if consecutive_failures >= max_consecutive_failures:
+                                self.logger.error(f"Too many consecutive failures, stopping")
+                                stop = True
+                                break
+                            continue
+                        
+                        # Extract chapter data
+                        chapter_data = self.extract_chapter_data(soup, number, content_element=content_element)
+                        if not chapter_data:
+                            consecutive_failures += 1
+                            if consecutive_failures >= max_consecutive_failures:
+                                stop = True
+                                break
+                            continue
+                        
+                        # Save chapter; False means a full buffer could not be written and is kept for a retry
+                        if self.save_chapter(novel_id, chapter_data):
+                            consecutive_failures = 0  # Reset failure counter
+                            
+                            # Log progress whenever a batch has been written
+                            if not self._chapter_buffer:
+                                self.logger.info(f"Progress: {self._saved_chapters} chapters scraped, "
+                                                 f"{self._saved_words:,} words")
+                        else:
+                            consecutive_failures += 1
+                            if consecutive_failures >= max_consecutive_failures:
+                                self.logger.error(f"Too many consecutive failures, stopping")
+                                stop = True
+                                break
+                        
+                        previous_soup = soup
+                        previous_url = url
+                        previous_number = number
+                        
+                    except Exception as e:
+                        self.logger.error(f"Error processing chapter {number}: {e}")
+                        consecutive_failures += 1
+                        if consecutive_failures >= max_consecutive_failures:
+                            stop = True
+                            break
+        
+        # Write whatever is left in the buffer
+        self.flush_chapters()
         
         self.logger.info(f"Chapter scraping completed!")
-        self.logger.info(f"   Chapters scraped: {chapters_scraped}")
-        self.logger.info(f"   Total words: {total_words:,}")
-        self.logger.info(f"   Last chapter attempted: {chapter_number - 1}")
+        self.logger.info(f"   Chapters scraped: {self._saved_chapters}")
+        self.logger.info(f"   Total words: {self._saved_words:,}")
+        if self._chapter_buffer:
+            self.logger.error(f"   Chapters not saved: {len(self._chapter_buffer)}")
+        self.logger.info(f"   Last chapter attempted: {last_attempted}")
+        if pages_requested:
+            self.logger.info(f"   Chapter URL 404s: {pattern_misses} of {pages_requested} "
+                             f"({pattern_misses / pages_requested:.1%})")
     
     def scrape_novel(self, novel_slug: str, start_chapter: int = 1, 
                     end_chapter: Optional[int] = None, novel_only: bool = False,
@@ -432,41 +634,49 @@ class DivineDaoLibraryScraper:
         # Connect to database
         self.connect_database()
         
-        # Scrape novel information
-        novel_info = self.scrape_novel_info(novel_slug)
-        if not novel_info:
-            self.logger.error(f"Failed to scrape novel info for: {novel_slug}")
-            return
-        
-        # Save/update novel in database
-        novel_id = self.get_or_create_novel(novel_info)
-        if not novel_id:
-            self.logger.error(f"Failed to save novel to database")
-            return
-        
-        if novel_only:
-            self.logger.info(f"Novel-only mode: Novel info saved for {novel_info['title']}")
-            return
-        
-        # Scrape chapters
-        self.scrape_chapters(novel_slug, novel_id, start_chapter, end_chapter, skip_existing)
-        
-        # Update total chapters count
-        cursor = self.db_connection.cursor()
         try:
-            cursor.execute("SELECT COUNT(*) FROM chapters WHERE novel_id = %s", (novel_id,))
-            total_chapters = cursor.fetchone()[0]
-            cursor.execute("UPDATE novels SET total_chapters = %s WHERE id = %s", (total_chapters, novel_id))
-            self.db_connection.commit()
-            self.logger.info(f"Updated total chapters count: {total_chapters}")
-        except pymysql.Error as e:
-            self.logger.error(f"Error updating total chapters: {e}")
+            # Scrape novel information
+            novel_info = self.scrape_novel_info(novel_slug)
+            if not novel_info:
+                self.logger.error(f"Failed to scrape novel info for: {novel_slug}")
+                return
+            
+            # Save/update novel in database
+            novel_id = self.get_or_create_novel(novel_info)
+            if not novel_id:
+                self.logger.error(f"Failed to save novel to database")
+                return
+            
+            if novel_only:
+                self.logger.info(f"Novel-only mode: Novel info saved for {novel_info['title']}")
+                return
+            
+            # Scrape chapters, flushing any buffered rows even if scraping is interrupted
+            if self.bulk:
+                self.set_bulk_load_mode(True)
+            try:
+                self.scrape_chapters(novel_slug, novel_id, start_chapter, end_chapter, skip_existing)
+            finally:
+                self.flush_chapters()
+                if self.bulk:
+                    self.set_bulk_load_mode(False)
+            
+            # Update total chapters count
+            try:
+                self.cursor.execute("SELECT COUNT(*) FROM chapters WHERE novel_id = %s", (novel_id,))
+                total_chapters = self.cursor.fetchone()[0]
+                self.cursor.execute("UPDATE novels SET total_chapters = %s WHERE id = %s", (total_chapters, novel_id))
+                self.db_connection.commit()
+                self.logger.info(f"Updated total chapters count: {total_chapters}")
+            except pymysql.Error as e:
+                self.logger.error(f"Error updating total chapters: {e}")
         finally:
-            cursor.close()
-        
-        # Close database connection
-        if self.db_connection:
-            self.db_connection.close()
+            # Close the shared cursor and database connection
+            if self.cursor:
+                self.cursor.close()
+                self.cursor = None
+            if self.db_connection:
+                self.db_connection.close()
 
 
 def main():
@@ -498,11 +708,32 @@ def main():
         default=True,
         help='Skip chapters that already exist in database'
     )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=10,
+        help='Number of chapter pages fetched in parallel (default: 10)'
+    )
+    parser.add_argument(
+        '--requests-per-second',
+        type=float,
+        default=5.0,
+        help='Target request rate, lowered automatically on 429/503 (default: 5)'
+    )
+    parser.add_argument(
+        '--bulk',
+        action='store_true',
+        help='Disable unique and foreign key checks for this session while loading chapters'
+    )
     
     args = parser.parse_args()
     
     try:
-        scraper = DivineDaoLibraryScraper()
+        scraper = DivineDaoLibraryScraper(
+            concurrency=args.concurrency,
+            requests_per_second=args.requests_per_second,
+            bulk=args.bulk
+        )
         scraper.scrape_novel(
             novel_slug=args.novel_slug,
             start_chapter=args.start_chapter,
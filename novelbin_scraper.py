@@ -17,48 +17,188 @@ Usage:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
 from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
+from lxml.cssselect import CSSSelector
+import diskcache
 import pymysql
 import argparse
 import time
 import re
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import atexit
 import os
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from dataclasses import dataclass
 from urllib.parse import urljoin, urlparse
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime
 from dotenv import load_dotenv
 
 
+# Visible page text, skipping script and style contents like BeautifulSoup's get_text()
+_PAGE_TEXT_XPATH = etree.XPath('//text()[not(ancestor::script) and not(ancestor::style)]')
+# Where 404s and page validators are kept between runs
+_HTTP_CACHE_DIR = '.novelbin_cache'
+# How long a 404 is remembered before the URL is requested again
+_MISSING_PAGE_TTL = 24 * 60 * 60
+# Chapter ranges at least this long are inserted with foreign key checks off
+_BULK_LOAD_MIN_CHAPTERS = 500
+
+# Multi-row chapter INSERTs, kept below MySQL's default 4 MB max_allowed_packet.
+# A chapter stored since the existence check (e.g. by a parallel run) is left as is
+# instead of failing the whole batch on the unique key.
+_CHAPTER_INSERT_SQL = (
+    "INSERT INTO chapters (novel_id, chapter_number, title, content, word_count, created_at, updated_at) VALUES "
+)
+_CHAPTER_ROW_PLACEHOLDER = "(%s, %s, %s, %s, %s, NOW(), NOW())"
+_CHAPTER_INSERT_SUFFIX = " ON DUPLICATE KEY UPDATE id = id"
+_MAX_INSERT_BYTES = 4 * 1024 * 1024 - 64 * 1024
+
+_CONTENT_TEXT_XPATH = etree.XPath('.//text()[not(ancestor::script) and not(ancestor::style)]')
+
+# Chapter links whose text mentions "next", matched case-insensitively in a single pass
+_NEXT_CHAPTER_XPATH = etree.XPath(
+    '//a[contains(@href, "/chapter-") and contains(translate(., "NEXT", "next"), "next")]/@href'
+)
+
+# Patterns compiled once at import instead of on every call
+_TITLE_SUFFIX_RE = re.compile(r'\s*-\s*Novel\s*Bin.*$', re.IGNORECASE)
+_AUTHOR_LABEL_RE = re.compile(r'Author.*:', re.IGNORECASE)
+_RATING_RE = re.compile(r'Rating:\s*([0-9.]+)\s*/\s*10')
+_YEAR_RE = re.compile(r'(\d{4})')
+_DESCRIPTION_RE = re.compile(r'Description\s*(.+?)(?:\n\s*Chapter\s*List|\n\s*More\s*from\s*author|$)',
+                             re.DOTALL | re.IGNORECASE)
+_DESCRIPTION_SUFFIX_RE = re.compile(r'Novel Bin.*$', re.IGNORECASE)
+_LATEST_CHAPTER_RE = re.compile(r'Chapter\s+(\d+)')
+_CHAPTER_HREF_RE = re.compile(r'/chapter-\d+')
+_CHAPTER_NUM_RE = re.compile(r'/chapter-(\d+)')
+_CHAPTER_TITLE_RE = re.compile(r'chapter\s*\d+', re.IGNORECASE)
+_NAV_TEXT_RE = re.compile(r'(Prev Chapter|Next Chapter)', re.IGNORECASE)
+_NAV_LINK_RE = re.compile(r'(Prev|Next)', re.IGNORECASE)
+_CHAPTER_LINE_RE = re.compile(r'Chapter \d+')
+_CONTENT_END_RE = re.compile(r'(Prev Chapter|Next Chapter|REMOVE ADS|Report chapter)', re.IGNORECASE)
+_AUTHOR_NOTE_RE = re.compile(r'A/N.*?Thank you.*?\^\^', re.DOTALL | re.IGNORECASE)
+
+# Chapter title and content selectors in fallback order, translated to XPath once at import
+_TITLE_SELECTORS = tuple(CSSSelector(css) for css in ('h2', 'h1', '.chapter-title', '.entry-title'))
+_CONTENT_SELECTORS = tuple(CSSSelector(css) for css in ('#chr-content', '.chr-c', '.chapter-content'))
+
+# Site boilerplate removed from chapter text, applied in order; each pass sees the text
+# left by the previous ones, so they are not merged into one alternation
+_CLEAN_PATTERNS = (
+    re.compile(r'MMORPG: Rebirth as an Alchemist.*?Chapter \d+', re.DOTALL | re.IGNORECASE),
+    re.compile(r'Enhance your reading experience.*?$', re.DOTALL | re.IGNORECASE),
+    re.compile(r'Novel Bin.*?$', re.DOTALL | re.IGNORECASE),
+    _AUTHOR_NOTE_RE,
+    re.compile(r'REMOVE ADS.*?$', re.DOTALL | re.IGNORECASE),
+    re.compile(r'Report chapter.*?$', re.DOTALL | re.IGNORECASE),
+    re.compile(r'Comments.*?$', re.DOTALL | re.IGNORECASE),
+    re.compile(r'Contact.*?ToS.*?$', re.DOTALL | re.IGNORECASE),
+    re.compile(r'Read Novel Online Full.*?$', re.DOTALL | re.IGNORECASE),
+    re.compile(r'Novel / GAME.*?$', re.DOTALL | re.IGNORECASE),
+)
+
+
+@dataclass(slots=True)
+class ChapterData:
+    """Chapter fields extracted from a chapter page."""
+    chapter_number: int
+    title: Optional[str] = None
+    content: Optional[str] = None
+    word_count: int = 0
+
+
 class NovelBinScraper:
-    def __init__(self):
+    __slots__ = ('base_url', 'concurrency', 'session', 'http_cache', 'logger', 'db_connection',
+                 'cursor', 'chapter_batch_size', '_pending_chapters', '_saved_chapters', '_saved_words',
+                 '_winning_title_selector', '_winning_content_selector')
+    
+    # Shared by every scraper in the process, like the root logger configuration
+    _log_listener: Optional[QueueListener] = None
+    
+    def __init__(self, concurrency: int = 8, cache_dir: Optional[str] = _HTTP_CACHE_DIR, batch_size: int = 50):
         """Initialize the scraper with NovelBin configuration."""
         self.base_url = "https://novelbin.com"
+        self.concurrency = max(1, concurrency)
         self.session = requests.Session()
         self.session.headers.update({
             "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.5",
-            "Accept-Encoding": "gzip, deflate",
+            "Accept-Encoding": ACCEPT_ENCODING,  # includes br when brotli is installed
             "Connection": "keep-alive",
             "Upgrade-Insecure-Requests": "1"
         })
+        # Retries with jittered exponential backoff happen in urllib3 instead of a sleep loop;
+        # connection errors and timeouts are retried as well as these statuses
+        retry = Retry(total=5, backoff_factor=1.0, backoff_max=30, backoff_jitter=1.0,
+                      status_forcelist=(429, 500, 502, 503, 504), allowed_methods=frozenset(['GET']))
+        # pool_block=False lets a worker open an extra connection instead of waiting for a free one
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(32, self.concurrency),
+                              max_retries=retry, pool_block=False)
+        self.session.mount('https://', adapter)
+        # Remembers 404s and page validators across runs so unchanged pages aren't downloaded again;
+        # cache_dir=None turns this off
+        self.http_cache = diskcache.Cache(cache_dir) if cache_dir else None
         load_dotenv()
         self.setup_logging()
         self.db_connection = None
+        self.cursor = None
+        self.chapter_batch_size = max(1, batch_size)
+        self._pending_chapters: List[tuple] = []
+        # Chapters and words actually committed by flush_chapters during the current scrape
+        self._saved_chapters = 0
+        self._saved_words = 0
+        # Selectors that matched the previous chapter are tried first on the next one
+        self._winning_title_selector: Optional[CSSSelector] = None
+        self._winning_content_selector: Optional[CSSSelector] = None
         
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Release the pooled HTTP connections and the disk cache."""
+        self.session.close()
+        if self.http_cache is not None:
+            self.http_cache.close()
+    
     def setup_logging(self):
-        """Setup logging configuration."""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('novelbin_scraper.log'),
-                logging.StreamHandler()
-            ]
-        )
+        """Setup logging configuration; a background thread writes records to the file and console."""
+        if NovelBinScraper._log_listener is None:
+            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+            file_handler = logging.FileHandler('novelbin_scraper.log')
+            file_handler.setFormatter(formatter)
+            stream_handler = logging.StreamHandler()
+            stream_handler.setFormatter(formatter)
+            
+            # Scrape threads only enqueue records; the listener does the blocking writes
+            log_queue = queue.SimpleQueue()
+            queue_handler = QueueHandler(log_queue)
+            queue_handler.setFormatter(logging.Formatter('%(message)s'))
+            NovelBinScraper._log_listener = QueueListener(log_queue, file_handler, stream_handler)
+            NovelBinScraper._log_listener.start()
+            atexit.register(NovelBinScraper.stop_logging)
+            
+            logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
         self.logger = logging.getLogger(__name__)
     
+    @staticmethod
+    def stop_logging():
+        """Write out any queued log records and stop the background logging thread."""
+        if NovelBinScraper._log_listener is not None:
+            NovelBinScraper._log_listener.stop()
+            NovelBinScraper._log_listener = None
+    
     def connect_database(self):
         """Connect to the MySQL database using environment variables."""
         try:
@@ -67,31 +207,106 @@ class NovelBinScraper:
                 user=os.getenv('DB_USER', 'root'),
                 password=os.getenv('DB_PASSWORD', ''),
                 database=os.getenv('DB_NAME', 'novel_db'),
-                charset=os.getenv('DB_CHARSET', 'utf8mb4')
+                charset=os.getenv('DB_CHARSET', 'utf8mb4'),
+                # Applied on every (re)connect: chapter batches only insert, so READ COMMITTED
+                # skips the gap locks and long-lived read views of the REPEATABLE READ default
+                init_command="SET SESSION TRANSACTION ISOLATION LEVEL READ COMMITTED"
             )
+            # One cursor is shared by every query in the run
+            self.cursor = self.db_connection.cursor()
             self.logger.info("Database connection established")
         except pymysql.Error as e:
-            self.logger.error(f"Database connection error: {e}")
+            self.logger.error("Database connection error: %s", e)
             raise
     
-    def fetch_page(self, url: str, retries: int = 3) -> Optional[BeautifulSoup]:
-        """Fetch and parse a web page with retry logic."""
-        for attempt in range(retries + 1):
+    def fetch_response(self, url: str, stream: bool = False,
+                       headers: Optional[Dict[str, str]] = None) -> Optional[requests.Response]:
+        """Fetch a web page; retries and backoff are handled by the session adapter."""
+        if self.http_cache is not None and self.http_cache.get(url) == 'MISS':
+            self.logger.info("Skipping %s, it returned 404 recently", url)
+            return None
+        
+        try:
+            self.logger.info("Fetching: %s", url)
+            response = self.session.get(url, timeout=30, stream=stream, headers=headers)
+            if response.status_code == 404 and self.http_cache is not None:
+                self.http_cache.set(url, 'MISS', expire=_MISSING_PAGE_TTL)
+            if response.status_code >= 400:
+                # An unread streamed body would otherwise keep its pooled connection
+                response.close()
+            response.raise_for_status()
+            return response
+            
+        except requests.RequestException as e:
+            self.logger.error("Failed to fetch %s: %s", url, e)
+            return None
+    
+    def declared_encoding(self, response: requests.Response) -> Optional[str]:
+        """Return the charset from the Content-Type header, or None when the server sent none."""
+        if 'charset=' in response.headers.get('Content-Type', '').lower():
+            return response.encoding
+        return None
+    
+    def fetch_content(self, url: str) -> Optional[Tuple[bytes, Optional[str]]]:
+        """Fetch a page body and its declared charset, revalidating a cached copy with a conditional GET."""
+        cached = self.http_cache.get(('page', url)) if self.http_cache is not None else None
+        headers = {}
+        if cached:
+            if cached['etag']:
+                headers['If-None-Match'] = cached['etag']
+            if cached['last_modified']:
+                headers['If-Modified-Since'] = cached['last_modified']
+        
+        response = self.fetch_response(url, headers=headers)
+        if response is None:
+            return None
+        if response.status_code == 304 and cached:
+            self.logger.info("Not modified, using cached copy of %s", url)
+            return cached['content'], cached.get('encoding')
+        
+        encoding = self.declared_encoding(response)
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if (etag or last_modified) and self.http_cache is not None:
+            self.http_cache.set(('page', url), {
+                'etag': etag,
+                'last_modified': last_modified,
+                'encoding': encoding,
+                'content': response.content
+            })
+        return response.content, encoding
+    
+    def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
+        """Fetch and parse a web page with BeautifulSoup."""
+        fetched = self.fetch_content(url)
+        if fetched is None:
+            return None
+        content, encoding = fetched
+        # Decode once with the declared charset so BeautifulSoup skips encoding detection
+        if encoding:
             try:
-                self.logger.info(f"Fetching: {url} (attempt {attempt + 1})")
-                response = self.session.get(url, timeout=30)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                return soup
-                
-            except requests.RequestException as e:
-                self.logger.warning(f"Request failed (attempt {attempt + 1}): {e}")
-                if attempt < retries:
-                    time.sleep(5 * (attempt + 1))  # Exponential backoff
-                else:
-                    self.logger.error(f"Failed to fetch {url} after {retries + 1} attempts")
-                    return None
+                return BeautifulSoup(content.decode(encoding, errors='replace'), 'lxml')
+            except LookupError:
+                pass
+        return BeautifulSoup(content, 'lxml')
+    
+    def fetch_tree(self, url: str) -> Optional[lxml_html.HtmlElement]:
+        """Fetch a web page and feed it into an lxml parser as it downloads."""
+        response = self.fetch_response(url, stream=True)
+        if response is None:
+            return None
+        try:
+            # A charset from the Content-Type header wins over lxml's latin-1 default
+            parser = lxml_html.HTMLParser(encoding=self.declared_encoding(response))
+            # Parse each chunk as it arrives instead of buffering the whole body first
+            for chunk in response.iter_content(chunk_size=16384):
+                parser.feed(chunk)
+            return parser.close()
+        except (requests.RequestException, etree.LxmlError) as e:
+            self.logger.error("Failed to read %s: %s", url, e)
+            return None
+        finally:
+            response.close()
     
     def scrape_novel_info(self, novel_slug: str) -> Optional[Dict[str, Any]]:
         """Scrape novel information from the novel's main page."""
@@ -115,6 +330,9 @@ class NovelBinScraper:
         }
         
         try:
+            # Serialize the page text once for the rating, description and chapter regexes
+            page_text = soup.get_text()
+            
             # Extract title - NovelBin uses h1 in main content or page title
             title_selectors = [
                 'h1',
@@ -127,7 +345,7 @@ class NovelBinScraper:
                 if title_element:
                     title_text = title_element.get_text(strip=True)
                     # Clean up title - remove "Novel Bin" suffix if present
-                    title_text = re.sub(r'\s*-\s*Novel\s*Bin.*$', '', title_text, flags=re.IGNORECASE)
+                    title_text = _TITLE_SUFFIX_RE.sub('', title_text)
                     if title_text and len(title_text) > 3:  # Ensure it's not just empty or very short
                         novel_info['title'] = title_text
                         break
@@ -147,9 +365,10 @@ class NovelBinScraper:
                     novel_info['author'] = author_element.get_text(strip=True)
                     break
             
-            # Fallback author extraction - look for text patterns
+            # Fallback author extraction - look for text patterns in the info list only
             if not novel_info['author']:
-                author_text = soup.find(string=re.compile(r'Author.*:', re.IGNORECASE))
+                info_section = soup.select_one('ul.info, .info-meta') or soup
+                author_text = info_section.find(string=_AUTHOR_LABEL_RE)
                 if author_text:
                     # Find next link or text after "Author:"
                     parent = author_text.parent
@@ -193,8 +412,7 @@ class NovelBinScraper:
                     break
             
             # Extract rating
-            rating_pattern = r'Rating:\s*([0-9.]+)\s*/\s*10'
-            rating_match = re.search(rating_pattern, soup.get_text())
+            rating_match = _RATING_RE.search(page_text)
             if rating_match:
                 try:
                     novel_info['rating'] = float(rating_match.group(1))
@@ -212,35 +430,23 @@ class NovelBinScraper:
                 year_element = soup.select_one(pattern)
                 if year_element:
                     year_text = year_element.get_text(strip=True)
-                    year_match = re.search(r'(\d{4})', year_text)
+                    year_match = _YEAR_RE.search(year_text)
                     if year_match:
                         novel_info['year'] = int(year_match.group(1))
                         break
             
-            # Extract description - look for description in various locations
-            description_selectors = [
-                'meta[name="description"]',
-                '.description',
-                '.novel-description',
-                '.summary',
-                'p:contains("Description")'
-            ]
-            
-            # Try meta description first
-            desc_meta = soup.select_one('meta[name="description"]')
+            # Extract description - the OG/meta description needs no text scanning
+            desc_meta = soup.select_one('meta[property="og:description"], meta[name="description"]')
             if desc_meta and desc_meta.get('content'):
                 novel_info['description'] = desc_meta.get('content').strip()
             else:
-                # Look for description in page content
-                description_text = soup.get_text()
-                # Find description section in the text
-                desc_match = re.search(r'Description\s*(.+?)(?:\n\s*Chapter\s*List|\n\s*More\s*from\s*author|$)', 
-                                     description_text, re.DOTALL | re.IGNORECASE)
+                # Find description section in the page text
+                desc_match = _DESCRIPTION_RE.search(page_text)
                 if desc_match:
                     desc_content = desc_match.group(1).strip()
                     # Clean up the description
-                    desc_content = re.sub(r'\s+', ' ', desc_content)
-                    desc_content = re.sub(r'Novel Bin.*$', '', desc_content, flags=re.IGNORECASE)
+                    desc_content = ' '.join(desc_content.split())
+                    desc_content = _DESCRIPTION_SUFFIX_RE.sub('', desc_content)
                     if len(desc_content) > 50:  # Ensure it's substantial
                         novel_info['description'] = desc_content
             
@@ -266,39 +472,36 @@ class NovelBinScraper:
                     break
             
             # Extract total chapters by looking for "READ NOW" link and latest chapter info
-            latest_chapter_text = soup.get_text()
-            chapter_match = re.search(r'Chapter\s+(\d+)', latest_chapter_text)
+            chapter_match = _LATEST_CHAPTER_RE.search(page_text)
             if chapter_match:
                 novel_info['total_chapters'] = int(chapter_match.group(1))
             
             # Alternative: count chapter links if available
             if novel_info['total_chapters'] == 0:
-                chapter_links = soup.find_all('a', href=re.compile(r'/chapter-\d+'))
+                chapter_links = soup.find_all('a', href=_CHAPTER_HREF_RE)
                 novel_info['total_chapters'] = len(chapter_links)
             
-            self.logger.info(f"Novel info extracted: {novel_info['title']} by {novel_info['author']}")
-            self.logger.info(f"Status: {novel_info['status']}, Chapters: {novel_info['total_chapters']}")
+            self.logger.info("Novel info extracted: %s by %s", novel_info['title'], novel_info['author'])
+            self.logger.info("Status: %s, Chapters: %s", novel_info['status'], novel_info['total_chapters'])
             return novel_info
             
         except Exception as e:
-            self.logger.error(f"Error extracting novel info: {e}")
+            self.logger.error("Error extracting novel info: %s", e)
             return None
     
     def get_or_create_novel(self, novel_info: Dict[str, Any]) -> Optional[int]:
         """Get or create novel in database and return novel_id."""
-        cursor = self.db_connection.cursor()
-        
         try:
             # Check if novel exists by slug
-            cursor.execute("SELECT id FROM novels WHERE slug = %s", (novel_info['slug'],))
-            result = cursor.fetchone()
+            self.cursor.execute("SELECT id FROM novels WHERE slug = %s", (novel_info['slug'],))
+            result = self.cursor.fetchone()
             
             if result:
                 novel_id = result[0]
-                self.logger.info(f"Found existing novel with ID: {novel_id}")
+                self.logger.info("Found existing novel with ID: %s", novel_id)
                 
                 # Update the novel with new information
-                cursor.execute("""
+                self.cursor.execute("""
                     UPDATE novels SET 
                         title = %s, author = %s, description = %s, cover_image = %s, 
                         total_chapters = %s, status = %s, updated_at = NOW()
@@ -309,10 +512,10 @@ class NovelBinScraper:
                     novel_info['status'], novel_id
                 ))
                 self.db_connection.commit()
-                self.logger.info(f"Updated existing novel: {novel_info['title']}")
+                self.logger.info("Updated existing novel: %s", novel_info['title'])
             else:
                 # Create new novel
-                cursor.execute("""
+                self.cursor.execute("""
                     INSERT INTO novels (title, slug, author, description, cover_image, 
                                       total_chapters, status, created_at, updated_at) 
                     VALUES (%s, %s, %s, %s, %s, %s, %s, NOW(), NOW())
@@ -322,103 +525,102 @@ class NovelBinScraper:
                     novel_info['total_chapters'], novel_info['status']
                 ))
                 self.db_connection.commit()
-                novel_id = cursor.lastrowid
-                self.logger.info(f"Created new novel with ID: {novel_id}")
+                novel_id = self.cursor.lastrowid
+                self.logger.info("Created new novel with ID: %s", novel_id)
             
             return novel_id
             
         except pymysql.Error as e:
-            self.logger.error(f"Database error managing novel: {e}")
+            self.logger.error("Database error managing novel: %s", e)
             return None
-        finally:
-            cursor.close()
+    
+    def chapter_url_prefix(self, novel_slug: str) -> str:
+        """Build the part of a chapter URL that precedes the chapter number."""
+        return f"{self.base_url}/b/{novel_slug}/chapter-"
     
     def build_chapter_url(self, novel_slug: str, chapter_number: int) -> str:
         """Build chapter URL from pattern."""
-        return f"{self.base_url}/b/{novel_slug}/chapter-{chapter_number}"
+        return self.chapter_url_prefix(novel_slug) + str(chapter_number)
     
-    def extract_chapter_data(self, soup: BeautifulSoup, chapter_number: int) -> Optional[Dict[str, Any]]:
-        """Extract chapter data from parsed HTML."""
+    def ordered_selectors(self, selectors: tuple, winner: Optional[CSSSelector]) -> tuple:
+        """Put the selector that matched last time ahead of the fallback list."""
+        if winner is None or selectors[0] is winner:
+            return selectors
+        return (winner,) + tuple(selector for selector in selectors if selector is not winner)
+    
+    def extract_chapter_data(self, tree: lxml_html.HtmlElement, chapter_number: int) -> Optional[ChapterData]:
+        """Extract chapter data from a parsed chapter page."""
         try:
-            chapter_data = {
-                'chapter_number': chapter_number,
-                'title': None,
-                'content': None
-            }
+            chapter_data = ChapterData(chapter_number)
             
             # Extract title - NovelBin uses h2 for chapter titles
-            title_selectors = [
-                'h2',
-                'h1',
-                '.chapter-title',
-                '.entry-title'
-            ]
-            
-            for selector in title_selectors:
-                title_element = soup.select_one(selector)
-                if title_element:
-                    title_text = title_element.get_text(strip=True)
+            for selector in self.ordered_selectors(_TITLE_SELECTORS, self._winning_title_selector):
+                title_elements = selector(tree)
+                if title_elements:
+                    title_text = title_elements[0].text_content().strip()
                     # Check if this looks like a chapter title
-                    if re.search(r'chapter\s*\d+', title_text, re.IGNORECASE) or len(title_text) < 100:
-                        chapter_data['title'] = title_text
+                    if _CHAPTER_TITLE_RE.search(title_text) or len(title_text) < 100:
+                        chapter_data.title = title_text
+                        self._winning_title_selector = selector
                         break
             
             # If no title found, set a default
-            if not chapter_data['title']:
-                chapter_data['title'] = f"Chapter {chapter_number}"
+            if not chapter_data.title:
+                chapter_data.title = f"Chapter {chapter_number}"
             
-            # NovelBin specific content extraction
-            # The content is typically in the main text flow between navigation links
-            page_text = soup.get_text()
+            # NovelBin serves the chapter text in its own container, so read just that node
+            content = None
+            page_text = None
+            content_element = None
+            for selector in self.ordered_selectors(_CONTENT_SELECTORS, self._winning_content_selector):
+                content_elements = selector(tree)
+                if content_elements:
+                    content_element = content_elements[0]
+                    self._winning_content_selector = selector
+                    break
             
-            # Find content between navigation elements
-            # Look for the pattern: navigation -> content -> navigation
-            nav_pattern = r'(Prev Chapter|Next Chapter)'
-            
-            # Split by navigation patterns and get the middle content
-            parts = re.split(nav_pattern, page_text, flags=re.IGNORECASE)
-            
-            # The content is usually in the middle parts
-            content_candidates = []
-            for i, part in enumerate(parts):
-                if not re.search(nav_pattern, part, re.IGNORECASE):
-                    # Clean and check if this looks like chapter content
-                    cleaned_part = part.strip()
-                    if len(cleaned_part) > 100:  # Substantial content
-                        content_candidates.append(cleaned_part)
-            
-            # Find the longest content candidate (likely the chapter content)
-            if content_candidates:
-                content = max(content_candidates, key=len)
+            if content_element is not None:
+                content = '\n'.join(text.strip() for text in _CONTENT_TEXT_XPATH(content_element) if text.strip())
+            else:
+                # Without the container, the content is in the main text flow between navigation links
+                page_text = ''.join(_PAGE_TEXT_XPATH(tree))
+                
+                # Split by navigation patterns and get the middle content
+                parts = _NAV_TEXT_RE.split(page_text)
+                
+                # The content is usually in the middle parts
+                content_candidates = []
+                for part in parts:
+                    if not _NAV_TEXT_RE.search(part):
+                        # Clean and check if this looks like chapter content
+                        cleaned_part = part.strip()
+                        if len(cleaned_part) > 100:  # Substantial content
+                            content_candidates.append(cleaned_part)
                 
-                # Clean the content
-                content = re.sub(r'\s+', ' ', content)  # Normalize whitespace
-                content = re.sub(r'\n\s*\n+', '\n\n', content)  # Normalize line breaks
+                # Find the longest content candidate (likely the chapter content)
+                if content_candidates:
+                    content = max(content_candidates, key=len)
+            
+            if content:
+                # Collapse whitespace runs in one C-level pass so the patterns below see single spaces
+                content = ' '.join(content.split())
                 
                 # Remove common unwanted patterns
-                content = re.sub(r'MMORPG: Rebirth as an Alchemist.*?Chapter \d+', '', content, flags=re.DOTALL | re.IGNORECASE)
-                content = re.sub(r'Enhance your reading experience.*?$', '', content, flags=re.DOTALL | re.IGNORECASE)
-                content = re.sub(r'Novel Bin.*?$', '', content, flags=re.DOTALL | re.IGNORECASE)
-                content = re.sub(r'A/N.*?Thank you.*?\^\^', '', content, flags=re.DOTALL | re.IGNORECASE)
-                content = re.sub(r'REMOVE ADS.*?$', '', content, flags=re.DOTALL | re.IGNORECASE)
-                content = re.sub(r'Report chapter.*?$', '', content, flags=re.DOTALL | re.IGNORECASE)
-                content = re.sub(r'Comments.*?$', '', content, flags=re.DOTALL | re.IGNORECASE)
-                content = re.sub(r'Contact.*?ToS.*?$', '', content, flags=re.DOTALL | re.IGNORECASE)
-                content = re.sub(r'Read Novel Online Full.*?$', '', content, flags=re.DOTALL | re.IGNORECASE)
-                content = re.sub(r'Novel / GAME.*?$', '', content, flags=re.DOTALL | re.IGNORECASE)
+                for pattern in _CLEAN_PATTERNS:
+                    content = pattern.sub('', content)
                 
-                # Clean up extra whitespace again
-                content = re.sub(r'\s+', ' ', content)
-                content = content.strip()
+                # Clean up whitespace left behind by the removals
+                content = ' '.join(content.split())
                 
                 # Ensure we have substantial content
                 if len(content) > 50:
-                    chapter_data['content'] = content
+                    chapter_data.content = content
             
             # Fallback: try to extract content from specific HTML structure
-            if not chapter_data['content']:
+            if not chapter_data.content:
                 # Look for content in paragraph elements between navigation
-                nav_elements = soup.find_all('a', string=re.compile(r'(Prev|Next)', re.IGNORECASE))
+                nav_elements = [link for link in tree.iter('a')
+                                if _NAV_LINK_RE.search(link.text_content())]
                 if len(nav_elements) >= 2:
                     # Find all text nodes between the first and last navigation elements
                     start_element = nav_elements[0]
@@ -428,17 +630,18 @@ class NovelBinScraper:
                     content_parts = []
                     
                     # Simple approach: get all text from the page and clean it
-                    full_text = soup.get_text()
-                    lines = full_text.split('\n')
+                    if page_text is None:
+                        page_text = ''.join(_PAGE_TEXT_XPATH(tree))
+                    lines = page_text.split('\n')
                     
                     # Find lines between "Chapter X" and navigation elements
                     in_content = False
                     for line in lines:
                         line = line.strip()
-                        if re.match(r'Chapter \d+', line):
+                        if _CHAPTER_LINE_RE.match(line):
                             in_content = True
                             continue
-                        elif re.search(r'(Prev Chapter|Next Chapter|REMOVE ADS|Report chapter)', line, re.IGNORECASE):
+                        elif _CONTENT_END_RE.search(line):
                             in_content = False
                             continue
                         elif in_content and len(line) > 10:
@@ -447,228 +650,331 @@ class NovelBinScraper:
                     if content_parts:
                         content = ' '.join(content_parts)
                         # Final cleanup
-                        content = re.sub(r'\s+', ' ', content)
-                        content = re.sub(r'A/N.*?Thank you.*?\^\^', '', content, flags=re.DOTALL | re.IGNORECASE)
-                        chapter_data['content'] = content.strip()
+                        content = ' '.join(content.split())
+                        content = _AUTHOR_NOTE_RE.sub('', content)
+                        chapter_data.content = ' '.join(content.split())
             
-            if not chapter_data['content']:
-                self.logger.warning(f"No content found for chapter {chapter_number}")
+            if not chapter_data.content:
+                self.logger.warning("No content found for chapter %s", chapter_number)
                 return None
-                
+            
+            # Both paths leave single spaces between words, so counting spaces avoids building a word list
+            chapter_data.word_count = chapter_data.content.count(' ') + 1
             return chapter_data
             
         except Exception as e:
-            self.logger.error(f"Error extracting chapter {chapter_number}: {e}")
+            self.logger.error("Error extracting chapter %s: %s", chapter_number, e)
             return None
     
-    def get_next_chapter_url(self, soup: BeautifulSoup, current_url: str) -> Optional[str]:
+    def get_next_chapter_url(self, tree: lxml_html.HtmlElement, current_url: str) -> Optional[str]:
         """Extract the next chapter URL from the current page."""
         try:
-            # Look for next chapter links
-            next_selectors = [
-                'a[href*="/chapter-"]:contains("Next")',
-                'a:contains("Next Chapter")'
-            ]
-            
-            for selector in next_selectors:
-                next_elements = soup.select(selector)
-                for next_element in next_elements:
-                    href = next_element.get('href')
-                    if href and '/chapter-' in href and href != current_url:
-                        if href.startswith('/'):
-                            href = self.base_url + href
-                        return href
-            
-            # Alternative method: look for next chapter pattern
-            next_links = soup.find_all('a', string=re.compile(r'Next', re.IGNORECASE))
-            for link in next_links:
-                href = link.get('href')
-                if href and '/chapter-' in href:
-                    if href.startswith('/'):
-                        href = self.base_url + href
+            for href in _NEXT_CHAPTER_XPATH(tree):
+                if href.startswith('/'):
+                    href = self.base_url + href
+                if href != current_url:
                     return href
             
             return None
             
         except Exception as e:
-            self.logger.error(f"Error finding next chapter URL: {e}")
+            self.logger.error("Error finding next chapter URL: %s", e)
             return None
     
-    def chapter_exists_in_db(self, novel_id: int, chapter_number: int) -> bool:
-        """Check if chapter already exists in database."""
-        cursor = self.db_connection.cursor()
+    def set_bulk_load_mode(self, enabled: bool):
+        """Toggle session-level foreign key checks off for bulk chapter loads, or back on."""
+        # unique_checks stays on: ON DUPLICATE KEY relies on unique_chapter to skip stored rows
+        value = 0 if enabled else 1
+        try:
+            self.cursor.execute(f"SET SESSION foreign_key_checks = {value}")
+            self.logger.info("Bulk load mode %s", 'enabled' if enabled else 'disabled')
+        except pymysql.Error as e:
+            self.logger.warning("Could not change bulk load session settings: %s", e)
+    
+    def get_existing_chapter_numbers(self, novel_id: int, lo: int, hi: int) -> set:
+        """Return the chapter numbers between lo and hi that already exist in database."""
         try:
-            cursor.execute(
-                "SELECT id FROM chapters WHERE novel_id = %s AND chapter_number = %s",
-                (novel_id, chapter_number)
+            self.cursor.execute(
+                "SELECT chapter_number FROM chapters WHERE novel_id = %s AND chapter_number BETWEEN %s AND %s",
+                (novel_id, lo, hi)
             )
-            return cursor.fetchone() is not None
+            return {row[0] for row in self.cursor.fetchall()}
         except pymysql.Error as e:
-            self.logger.error(f"Database error checking chapter existence: {e}")
-            return False
-        finally:
-            cursor.close()
+            self.logger.error("Database error loading existing chapters: %s", e)
+            return set()
+    
+    def save_chapter(self, novel_id: int, chapter_data: ChapterData) -> bool:
+        """Queue chapter for the next batched insert."""
+        self._pending_chapters.append((
+            novel_id,
+            chapter_data.chapter_number,
+            chapter_data.title or '',
+            chapter_data.content or '',
+            chapter_data.word_count
+        ))
+        self.logger.info("Chapter %s queued - %s words", chapter_data.chapter_number, chapter_data.word_count)
+        return True
+    
+    def split_rows_by_size(self, rows: List[tuple]) -> List[List[tuple]]:
+        """Group chapter rows so each INSERT statement stays under max_allowed_packet."""
+        groups = []
+        current = []
+        current_size = 0
+        for row in rows:
+            row_size = len(row[3].encode('utf-8')) + len(row[2].encode('utf-8'))
+            if current and current_size + row_size > _MAX_INSERT_BYTES:
+                groups.append(current)
+                current = []
+                current_size = 0
+            current.append(row)
+            current_size += row_size
+        if current:
+            groups.append(current)
+        return groups
     
-    def save_chapter(self, novel_id: int, chapter_data: Dict[str, Any]) -> bool:
-        """Save chapter to database."""
-        cursor = self.db_connection.cursor()
+    def flush_chapters(self) -> bool:
+        """Insert all queued chapters with multi-row INSERTs and a single commit; they stay queued if it fails."""
+        if not self._pending_chapters:
+            return True
+        
         try:
-            # Calculate word count
-            content = chapter_data.get('content', '')
-            word_count = len(content.split()) if content else 0
-            
-            cursor.execute(
-                """INSERT INTO chapters (novel_id, chapter_number, title, content, word_count, created_at, updated_at) 
-                   VALUES (%s, %s, %s, %s, %s, NOW(), NOW())""",
-                (
-                    novel_id,
-                    chapter_data['chapter_number'],
-                    chapter_data.get('title', ''),
-                    content,
-                    word_count
+            # Start the batch's transaction explicitly so it doesn't carry over the
+            # implicit one left open by earlier existence-check SELECTs
+            self.db_connection.begin()
+            # One multi-row INSERT per packet-sized group of chapters
+            for rows in self.split_rows_by_size(self._pending_chapters):
+                self.cursor.execute(
+                    _CHAPTER_INSERT_SQL
+                    + ", ".join([_CHAPTER_ROW_PLACEHOLDER] * len(rows))
+                    + _CHAPTER_INSERT_SUFFIX,
+                    [value for row in rows for value in row]
                 )
-            )
             self.db_connection.commit()
-            
-            self.logger.info(f"Chapter {chapter_data['chapter_number']} saved - {word_count} words")
-            return True
         except pymysql.Error as e:
-            self.logger.error(f"Database error saving chapter {chapter_data['chapter_number']}: {e}")
+            self.db_connection.rollback()
+            self.logger.error("Database error saving chapters %s-%s, keeping them for the next attempt: %s",
+                              self._pending_chapters[0][1], self._pending_chapters[-1][1], e)
             return False
-        finally:
-            cursor.close()
+        
+        self._saved_chapters += len(self._pending_chapters)
+        self._saved_words += sum(row[4] for row in self._pending_chapters)
+        self.logger.info("Saved %d chapters to database", len(self._pending_chapters))
+        self._pending_chapters.clear()
+        return True
+    
+    def scrape_chapter(self, url: str, chapter_number: int) -> Tuple[Optional[ChapterData], Optional[str]]:
+        """Fetch and parse one chapter, returning its data and the next button's URL."""
+        tree = self.fetch_tree(url)
+        if tree is None:
+            return None, None
+        chapter_data = self.extract_chapter_data(tree, chapter_number)
+        if not chapter_data:
+            return None, None
+        return chapter_data, self.get_next_chapter_url(tree, url)
     
     def scrape_chapters(self, novel_slug: str, novel_id: int, start_chapter: int = 1, 
                        end_chapter: Optional[int] = None, skip_existing: bool = True):
-        """Scrape chapters using next button navigation."""
-        self.logger.info(f"Starting chapter scraping from chapter {start_chapter}")
+        """Scrape chapters in concurrently fetched batches, downloading one batch while the previous is saved."""
+        self.logger.info("Starting chapter scraping from chapter %s (%d concurrent requests)",
+                         start_chapter, self.concurrency)
         
-        # Build first chapter URL
-        current_url = self.build_chapter_url(novel_slug, start_chapter)
+        url_prefix = self.chapter_url_prefix(novel_slug)
         chapter_number = start_chapter
         consecutive_failures = 0
         max_consecutive_failures = 5
-        chapters_scraped = 0
-        total_words = 0
+        # Only chapters committed to the database count as scraped
+        self._saved_chapters = 0
+        self._saved_words = 0
+        stop = False
+        existing_chapters = set()
+        existing_window_end = start_chapter - 1
+        existing_window_size = 1000
+        pending = []  # (chapter number, url, future) for the batch currently downloading
+        last_attempted = None  # Highest chapter actually processed; batches are fetched ahead of it
+        last_submit = 0.0
         
-        while current_url and (not end_chapter or chapter_number <= end_chapter):
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
             try:
-                # Check if chapter already exists
-                if skip_existing and self.chapter_exists_in_db(novel_id, chapter_number):
-                    self.logger.info(f"Chapter {chapter_number} already exists, skipping")
-                    chapter_number += 1
-                    current_url = self.build_chapter_url(novel_slug, chapter_number)
-                    continue
-                
-                # Fetch chapter page
-                soup = self.fetch_page(current_url)
-                if not soup:
-                    consecutive_failures += 1
-                    if consecutive_failures >= max_consecutive_failures:
-                        self.logger.error(f"Too many consecutive failures, stopping at chapter {chapter_number}")
-                        break
-                    chapter_number += 1
-                    current_url = self.build_chapter_url(novel_slug, chapter_number)
-                    continue
-                
-                # Extract chapter data
-                chapter_data = self.extract_chapter_data(soup, chapter_number)
-                if not chapter_data:
-                    consecutive_failures += 1
-                    if consecutive_failures >= max_consecutive_failures:
-                        self.logger.error(f"Too many consecutive failures, stopping at chapter {chapter_number}")
-                        break
-                    chapter_number += 1
-                    current_url = self.build_chapter_url(novel_slug, chapter_number)
-                    continue
-                
-                # Save chapter to database
-                if self.save_chapter(novel_id, chapter_data):
-                    chapters_scraped += 1
-                    total_words += len(chapter_data.get('content', '').split())
-                    consecutive_failures = 0  # Reset counter on success
-                else:
-                    consecutive_failures += 1
-                
-                # Get next chapter URL
-                next_url = self.get_next_chapter_url(soup, current_url)
-                if next_url:
-                    current_url = next_url
-                    # Extract chapter number from URL
-                    next_chapter_match = re.search(r'/chapter-(\d+)', next_url)
-                    if next_chapter_match:
-                        chapter_number = int(next_chapter_match.group(1))
-                    else:
+                while not stop:
+                    # Collect the next batch of chapters, skipping ones already stored
+                    batch = []
+                    while len(batch) < self.concurrency and (not end_chapter or chapter_number <= end_chapter):
+                        # Load stored chapter numbers one window at a time instead of querying per chapter
+                        if skip_existing and chapter_number > existing_window_end:
+                            existing_window_end = chapter_number + existing_window_size - 1
+                            if end_chapter:
+                                existing_window_end = min(existing_window_end, end_chapter)
+                            existing_chapters = self.get_existing_chapter_numbers(
+                                novel_id, chapter_number, existing_window_end)
+                        
+                        if skip_existing and chapter_number in existing_chapters:
+                            self.logger.info("Chapter %s already exists, skipping", chapter_number)
+                        else:
+                            batch.append(chapter_number)
                         chapter_number += 1
-                else:
-                    # Try incrementing chapter number
-                    chapter_number += 1
-                    current_url = self.build_chapter_url(novel_slug, chapter_number)
-                
-                # Add delay between requests
-                time.sleep(2)
-                
-            except Exception as e:
-                self.logger.error(f"Error processing chapter {chapter_number}: {e}")
-                consecutive_failures += 1
-                if consecutive_failures >= max_consecutive_failures:
-                    self.logger.error(f"Too many consecutive failures, stopping at chapter {chapter_number}")
-                    break
-                chapter_number += 1
-                current_url = self.build_chapter_url(novel_slug, chapter_number)
+                    
+                    # Start fetching and parsing it before the previous batch is processed,
+                    # keeping at least 2 seconds between batches
+                    submitted = []
+                    if batch:
+                        delay = 2 - (time.monotonic() - last_submit)
+                        if delay > 0:
+                            time.sleep(delay)
+                        last_submit = time.monotonic()
+                        for number in batch:
+                            url = url_prefix + str(number)
+                            submitted.append((number, url, executor.submit(self.scrape_chapter, url, number)))
+                    
+                    current, pending = pending, submitted
+                    if not current:
+                        if not pending:
+                            break
+                        continue
+                    
+                    # Process the finished batch in order; parsing happened on the worker threads
+                    # and DB writes stay on this thread
+                    last_next_url = None
+                    last_number = None
+                    for number, url, future in current:
+                        last_attempted = number
+                        try:
+                            chapter_data, next_url = future.result()
+                            if not chapter_data:
+                                consecutive_failures += 1
+                                if consecutive_failures >= max_consecutive_failures:
+                                    self.logger.error("Too many consecutive failures, stopping at chapter %s", number)
+                                    stop = True
+                                    break
+                                continue
+                            
+                            # Save chapter to database
+                            if self.save_chapter(novel_id, chapter_data):
+                                # A failed batch stays queued and is retried with the next chapter
+                                if len(self._pending_chapters) >= self.chapter_batch_size and not self.flush_chapters():
+                                    consecutive_failures += 1
+                                    if consecutive_failures >= max_consecutive_failures:
+                                        self.logger.error("Too many consecutive failures, stopping at chapter %s", number)
+                                        stop = True
+                                        break
+                                else:
+                                    consecutive_failures = 0  # Reset counter on success
+                                    if not self._pending_chapters:
+                                        self.logger.info("Progress: %d chapters scraped, %s words",
+                                                         self._saved_chapters, format(self._saved_words, ','))
+                            else:
+                                consecutive_failures += 1
+                            
+                            last_next_url = next_url
+                            last_number = number
+                            
+                        except Exception as e:
+                            self.logger.error("Error processing chapter %s: %s", number, e)
+                            consecutive_failures += 1
+                            if consecutive_failures >= max_consecutive_failures:
+                                self.logger.error("Too many consecutive failures, stopping at chapter %s", number)
+                                stop = True
+                                break
+                    
+                    # Follow the next button when it skips ahead of the URL pattern,
+                    # dropping prefetched chapters that fall inside the gap
+                    if not stop and last_number is not None:
+                        next_chapter_match = _CHAPTER_NUM_RE.search(last_next_url) if last_next_url else None
+                        if next_chapter_match and int(next_chapter_match.group(1)) > last_number + 1:
+                            next_number = int(next_chapter_match.group(1))
+                            for number, url, future in pending:
+                                if number < next_number:
+                                    future.cancel()
+                            pending = [entry for entry in pending if entry[0] >= next_number]
+                            chapter_number = max(chapter_number, next_number)
+            finally:
+                # Don't wait on downloads that will never be processed
+                for number, url, future in pending:
+                    future.cancel()
+        
+        # Write whatever is left in the buffer
+        self.flush_chapters()
         
-        self.logger.info(f"Chapter scraping completed!")
-        self.logger.info(f"   Chapters scraped: {chapters_scraped}")
-        self.logger.info(f"   Total words: {total_words:,}")
-        self.logger.info(f"   Last chapter attempted: {chapter_number - 1}")
+        self.logger.info("Chapter scraping completed!")
+        self.logger.info("   Chapters scraped: %d", self._saved_chapters)
+        self.logger.info("   Total words: %s", format(self._saved_words, ','))
+        if self._pending_chapters:
+            self.logger.error("   Chapters not saved: %d", len(self._pending_chapters))
+        self.logger.info("   Last chapter attempted: %s", last_attempted)
     
     def scrape_novel(self, novel_slug: str, start_chapter: int = 1, 
                     end_chapter: Optional[int] = None, novel_only: bool = False,
                     skip_existing: bool = True):
         """Main scraping method."""
-        self.logger.info(f"Starting scrape for novel: {novel_slug}")
+        self.logger.info("Starting scrape for novel: %s", novel_slug)
         
         # Connect to database
         self.connect_database()
         
-        # Scrape novel information
-        novel_info = self.scrape_novel_info(novel_slug)
-        if not novel_info:
-            self.logger.error(f"Failed to scrape novel info for: {novel_slug}")
-            return
-        
-        # Save/update novel in database
-        novel_id = self.get_or_create_novel(novel_info)
-        if not novel_id:
-            self.logger.error(f"Failed to save novel to database")
-            return
-        
-        if novel_only:
-            self.logger.info(f"Novel-only mode: Novel info saved for {novel_info['title']}")
-            return
-        
-        # Scrape chapters
-        self.scrape_chapters(novel_slug, novel_id, start_chapter, end_chapter, skip_existing)
-        
-        # Update total chapters count
-        cursor = self.db_connection.cursor()
         try:
-            cursor.execute("SELECT COUNT(*) FROM chapters WHERE novel_id = %s", (novel_id,))
-            total_chapters = cursor.fetchone()[0]
-            cursor.execute("UPDATE novels SET total_chapters = %s WHERE id = %s", (total_chapters, novel_id))
-            self.db_connection.commit()
-            self.logger.info(f"Updated total chapters count: {total_chapters}")
-        except pymysql.Error as e:
-            self.logger.error(f"Error updating total chapters: {e}")
+            # Scrape novel information
+            novel_info = self.scrape_novel_info(novel_slug)
+            if not novel_info:
+                self.logger.error("Failed to scrape novel info for: %s", novel_slug)
+                return
+            
+            # Save/update novel in database
+            novel_id = self.get_or_create_novel(novel_info)
+            if not novel_id:
+                self.logger.error("Failed to save novel to database")
+                return
+            
+            if novel_only:
+                self.logger.info("Novel-only mode: Novel info saved for %s", novel_info['title'])
+                return
+            
+            # Scrape chapters; the novel row was just written, so long ranges skip foreign key checks
+            bulk = end_chapter is not None and end_chapter - start_chapter >= _BULK_LOAD_MIN_CHAPTERS
+            if bulk:
+                self.set_bulk_load_mode(True)
+            try:
+                self.scrape_chapters(novel_slug, novel_id, start_chapter, end_chapter, skip_existing)
+            finally:
+                # Keep buffered chapters even if scraping is interrupted
+                self.flush_chapters()
+                if bulk:
+                    self.set_bulk_load_mode(False)
+            
+            # Update total chapters count
+            try:
+                self.cursor.execute("SELECT COUNT(*) FROM chapters WHERE novel_id = %s", (novel_id,))
+                total_chapters = self.cursor.fetchone()[0]
+                self.cursor.execute("UPDATE novels SET total_chapters = %s WHERE id = %s", (total_chapters, novel_id))
+                self.db_connection.commit()
+                self.logger.info("Updated total chapters count: %s", total_chapters)
+            except pymysql.Error as e:
+                self.logger.error("Error updating total chapters: %s", e)
         finally:
-            cursor.close()
-        
-        # Close database connection
-        if self.db_connection:
-            self.db_connection.close()
+            # Close the shared cursor and database connection
+            if self.cursor:
+                self.cursor.close()
+                self.cursor = None
+            if self.db_connection:
+                self.db_connection.close()
 
 
-def main():
+def run(novel_slug: str, start_chapter: int = 1, end_chapter: Optional[int] = None,
+        novel_only: bool = False, skip_existing: bool = True,
+        batch_size: int = 50, concurrency: int = 8, http_cache: bool = True):
+    """Scrape a novel without going through the command line parser."""
+    cache_dir = _HTTP_CACHE_DIR if http_cache else None
+    with NovelBinScraper(concurrency=concurrency, cache_dir=cache_dir, batch_size=batch_size) as scraper:
+        scraper.scrape_novel(
+            novel_slug=novel_slug,
+            start_chapter=start_chapter,
+            end_chapter=end_chapter,
+            novel_only=novel_only,
+            skip_existing=skip_existing
+        )
+
+
+@lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser once per process."""
     parser = argparse.ArgumentParser(description="NovelBin.com Specialized Scraper")
     parser.add_argument(
         '--novel-slug',
@@ -697,22 +1003,43 @@ def main():
         default=True,
         help='Skip chapters that already exist in database'
     )
-    
-    args = parser.parse_args()
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=50,
+        help='Chapters written per database transaction (default: 50)'
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=8,
+        help='Chapter pages fetched at the same time (default: 8)'
+    )
+    parser.add_argument(
+        '--no-http-cache',
+        dest='http_cache',
+        action='store_false',
+        help='Do not read or write the on-disk cache of 404s and page validators'
+    )
+    return parser
+
+
+def main():
+    args = _build_parser().parse_args()
     
     try:
-        scraper = NovelBinScraper()
-        scraper.scrape_novel(
-            novel_slug=args.novel_slug,
-            start_chapter=args.start_chapter,
-            end_chapter=args.end_chapter,
-            novel_only=args.novel_only,
-            skip_existing=args.skip_existing
-        )
+        run(**vars(args))
         
+    except KeyboardInterrupt:
+        # Chapters fetched so far were written on the way out
+        logging.warning("Scraper interrupted, chapters saved so far are kept")
+        raise SystemExit(130)
     except Exception as e:
         logging.error(f"Scraper failed with error: {e}")
         raise
+    finally:
+        # Flush the last records, including the messages above, on every way out
+        NovelBinScraper.stop_logging()
 
 
 if __name__ == "__main__":
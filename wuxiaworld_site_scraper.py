@@ -9,44 +9,202 @@ Features:
 - Scrapes novel metadata (title, author, description, cover image, etc.)
 - Scrapes chapters with markdown-style headers (### Chapter X)
 - Handles navigation-based approach with "[ Next]" links
+- Fetches chapters concurrently in batches (see --concurrency)
 - Robust error handling and retry logic
+- Delay between batches adapts to throttling (429/503, timeouts)
 - Database operations for both novels and chapters
+- Novel and chapter pages parsed with lxml and precompiled selectors
+- Novel info cached on disk and revalidated with conditional GETs (see --no-http-cache)
+- Several novels per run share one database connection (pass multiple slugs)
 
 Usage:
     python wuxiaworld_site_scraper.py --novel-slug not-all-heroes-from-earth-are-bad --start-chapter 1
     python wuxiaworld_site_scraper.py --novel-slug not-all-heroes-from-earth-are-bad --novel-only
+    python wuxiaworld_site_scraper.py --novel-slug first-novel-slug second-novel-slug
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
+import diskcache
+from lxml import etree, html as lxml_html
+from lxml.cssselect import CSSSelector
 import pymysql
 import argparse
 import time
 import re
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from urllib.parse import urljoin, urlparse
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 import os
+import html
 from dotenv import load_dotenv
 
 
+# Novel info and its ETag/Last-Modified validators are kept here between runs
+_HTTP_CACHE_DIR = '.wuxiaworld_site_cache'
+
+# Explicit chapter ranges at least this long are inserted with foreign key checks off
+_BULK_LOAD_MIN_CHAPTERS = 500
+
+# Visible text, skipping script and style contents like BeautifulSoup's get_text()
+_TEXT_XPATH = etree.XPath('.//text()[not(ancestor::script) and not(ancestor::style)]')
+# Every text node on the page, as BeautifulSoup's find(string=...) scans them
+_ALL_TEXT_XPATH = etree.XPath('//text()')
+_META_DESCRIPTION_XPATH = etree.XPath('//meta[@name="description"]')
+# Chapter links on the novel page, matched inside libxml2 instead of a Python callback per link
+_LOWER_HREF = "translate(@href, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+_CHAPTER_HREF_XPATH = etree.XPath('//a[contains(@href, "/chapter-")]/@href')
+_ANY_CHAPTER_HREF_XPATH = etree.XPath(f'//a[contains({_LOWER_HREF}, "chapter")]/@href')
+
+# Patterns compiled once at import instead of on every call
+_CHAPTER_PREFIX_RE = re.compile(r'^Chapter\s*\d+\s*[-:]?\s*', re.IGNORECASE)
+_HEADER_RE = re.compile(r'(chapter\s*\d+|prologue|epilogue)', re.IGNORECASE)
+_MARKDOWN_HEADER_RE = re.compile(r'###\s*(chapter\s*\d+|prologue|epilogue)', re.IGNORECASE)
+_NAV_LINE_RE = re.compile(r'^\[\s*(next|previous|prev)\s*\]', re.IGNORECASE)
+_MULTI_NL_RE = re.compile(r'\n\s*\n\s*\n+')
+_CHAPTER_NUM_RE = re.compile(r'chapter-(\d+)')
+# Author link following the "Author(s)" heading, matched on the raw novel page
+# bytes so the DOM walk below only runs when the markup differs
+_AUTHOR_RE = re.compile(rb'Author\(s\)\s*(?:<[^>]+>\s*)*?<a[^>]*>([^<]+)</a>', re.IGNORECASE)
+
+# Chapter page selectors in fallback order, translated to XPath once at import
+_TITLE_SELECTORS = tuple(CSSSelector(css) for css in (
+    'h1.entry-title', 'h1.chapter-title', 'h1', '.post-title h1', '.chapter-title'
+))
+_CONTENT_SELECTORS = tuple(CSSSelector(css) for css in (
+    '.entry-content', '.post-content', '.chapter-content', '.content', '#content', '.post-body'
+))
+# Elements only found on the novel homepage
+_CHAPTER_LINK_SELECTOR = CSSSelector('a[href*="chapter-"]')
+_HOMEPAGE_SELECTORS = tuple(CSSSelector(css) for css in (
+    'div.summary', 'div.novel-info', '.author-info', '.genre-tags',
+    'h2:contains("Summary")', 'h2:contains("SUMMARY")', '.rating', '.novel-status'
+))
+
+# Novel page selectors, tried in order
+_AUTHOR_SELECTORS = tuple(CSSSelector(css) for css in (
+    'span.author', 'div.author', '.novel-author', '.author-name'
+))
+_DESCRIPTION_SELECTORS = tuple(CSSSelector(css) for css in (
+    'div.summary', 'div.description', 'div.novel-description', 'div.content p', '.entry-content p'
+))
+_COVER_SELECTORS = tuple(CSSSelector(css) for css in (
+    'img.cover', 'img.novel-cover', 'div.cover img', 'div.novel-image img', 'img[alt*="cover"]',
+    'img[src*="cover"]', '.summary-image img', '.novel-thumbnail img', '.wp-post-image'
+))
+_GENRE_SELECTORS = tuple(CSSSelector(css) for css in ('.genres a', '.genre-tags a', '.tags a', 'span.genre'))
+_STATUS_SELECTORS = tuple(CSSSelector(css) for css in ('.status', '.novel-status', 'span.completed', 'span.ongoing'))
+# The novel page's table of contents, as opposed to stray "read first/latest" chapter links
+_CHAPTER_LIST_SELECTOR = CSSSelector('div.chapter-list a, li.wp-manga-chapter a')
+
+# Logos, icons and ads checked against "src|alt" of fallback cover candidates
+_SKIP_IMG_RE = re.compile(r'icon|logo|avatar|\bad\b|banner', re.IGNORECASE)
+# Images whose src looks like an upload or cover, plus the novel's own slug
+_LOWER_SRC = "translate(@src, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+_COVER_FALLBACK_XPATH = etree.XPath(
+    f'//img[contains({_LOWER_SRC}, "upload") or contains({_LOWER_SRC}, "thumb")'
+    f' or contains({_LOWER_SRC}, "cover") or contains({_LOWER_SRC}, $slug)]'
+)
+# Everything stripped from chapter content, tags and navigation/ad classes in one query
+_UNWANTED_SELECTOR = CSSSelector(
+    'script, style, nav, footer, header, .navigation, .nav, .prev-next, .chapter-nav, .ads, .advertisement'
+)
+# Short navigation strings such as "Next" or "Previous Chapter"
+_NAV_TEXT_RE = re.compile(r'\b(next|prev(ious)?)\b', re.IGNORECASE)
+# Class names of navigation containers, tested without lowering the class attribute per word
+_NAV_CLASS_RE = re.compile('nav|chapter|next|pagination', re.IGNORECASE)
+_NAV_SKIP_PHRASES = (
+    'table of contents', 'next chapter', 'previous chapter', 'click here', 'read more', 'subscribe', 'donate'
+)
+# One scan per content line instead of a substring test per phrase
+_SKIP_LINE_RE = re.compile('|'.join(re.escape(phrase) for phrase in _NAV_SKIP_PHRASES), re.IGNORECASE)
+# Words that give away a novel homepage or summary instead of chapter text
+_SUMMARY_INDICATORS = ('summary', 'author(s)', 'genre(s)', 'alternative', 'rating', 'status')
+_STORY_INDICATORS = ('"', 'he said', 'she said', 'thought', 'looked', 'walked')
+
+# Multi-row chapter INSERTs, kept below MySQL's default 4 MB max_allowed_packet.
+# A chapter stored since the existence check is left as is instead of failing
+# the whole batch on the unique key.
+_CHAPTER_INSERT_SQL = (
+    "INSERT INTO chapters (novel_id, chapter_number, title, content, word_count, created_at, updated_at) VALUES "
+)
+_CHAPTER_ROW_PLACEHOLDER = "(%s, %s, %s, %s, %s, NOW(), NOW())"
+_CHAPTER_INSERT_SUFFIX = " ON DUPLICATE KEY UPDATE id = id"
+_MAX_INSERT_BYTES = 4 * 1024 * 1024 - 64 * 1024
+
+
+@dataclass(slots=True)
+class ChapterPage:
+    """A parsed chapter page with the lookups shared by the page check and the extractor."""
+    tree: lxml_html.HtmlElement
+    page_text: str  # lowercased visible text
+    title_element: Optional[lxml_html.HtmlElement]
+    content_matches: Dict[CSSSelector, list]  # results of the content selectors run so far
+
+
+@dataclass(slots=True)
+class ChapterData:
+    """Chapter fields extracted from a chapter page."""
+    chapter_number: int
+    title: Optional[str] = None
+    content: Optional[str] = None
+    word_count: int = 0
+
+
 class WuxiaworldSiteScraper:
-    def __init__(self):
+    __slots__ = ('base_url', 'concurrency', 'session', '_rate_lock', '_min_delay', '_max_delay', '_delay', '_throttled',
+                 'http_cache', 'logger', 'db_connection', 'cursor', 'chapter_batch_size', '_pending_chapters',
+                 '_saved_chapters', '_saved_words',
+                 '_winning_title_selector', '_winning_content_selector')
+    
+    def __init__(self, concurrency: int = 8, batch_size: int = 50, cache_dir: Optional[str] = _HTTP_CACHE_DIR):
         """Initialize the scraper with Wuxiaworld.site configuration."""
         self.base_url = "https://wuxiaworld.site"
+        self.concurrency = max(1, concurrency)
         self.session = requests.Session()
         self.session.headers.update({
             "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.5",
-            "Accept-Encoding": "gzip, deflate",
+            "Accept-Encoding": ACCEPT_ENCODING,  # includes br when brotli is installed
             "Connection": "keep-alive",
             "Upgrade-Insecure-Requests": "1"
         })
+        # Retries with exponential backoff happen in urllib3 instead of a sleep loop
+        retry = Retry(total=3, backoff_factor=1.5, status_forcelist=(429, 500, 502, 503, 504),
+                      allowed_methods=frozenset(['GET']))
+        # Enough pooled connections for every fetch worker to keep its connection alive
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(32, self.concurrency), max_retries=retry)
+        self.session.mount('https://', adapter)
+        # Pause between chapter batches; it shrinks while requests go through cleanly
+        # and doubles when the server throttles us
+        self._rate_lock = threading.Lock()
+        self._min_delay = 0.5
+        self._max_delay = 30.0
+        self._delay = 2.0
+        # Set by any fetch the server throttled; read and reset once per batch
+        self._throttled = False
+        # cache_dir=None turns this off
+        self.http_cache = diskcache.Cache(cache_dir) if cache_dir else None
         load_dotenv()
         self.setup_logging()
         self.db_connection = None
+        self.cursor = None
+        # Chapter rows waiting for the next batched insert
+        self.chapter_batch_size = max(1, batch_size)
+        self._pending_chapters = []
+        # Chapters and words actually committed by flush_chapters during the current scrape
+        self._saved_chapters = 0
+        self._saved_words = 0
+        # Selectors that matched the previous chapter are tried first on the next one
+        self._winning_title_selector: Optional[CSSSelector] = None
+        self._winning_content_selector: Optional[CSSSelector] = None
         
     def setup_logging(self):
         """Setup logging configuration."""
@@ -62,6 +220,10 @@ class WuxiaworldSiteScraper:
     
     def connect_database(self):
         """Connect to the MySQL database using environment variables."""
+        if self.db_connection is not None and self.db_connection.open:
+            # Later novels in the same run keep the connection, reconnecting if it timed out
+            self.db_connection.ping(reconnect=True)
+            return
         try:
             self.db_connection = pymysql.connect(
                 host=os.getenv('DB_HOST', 'localhost'),
@@ -70,44 +232,158 @@ class WuxiaworldSiteScraper:
                 database=os.getenv('DB_NAME', 'novel_db'),
                 charset=os.getenv('DB_CHARSET', 'utf8mb4')
             )
+            # One cursor is shared by every query in the run
+            self.cursor = self.db_connection.cursor()
             self.logger.info("Database connection established")
         except pymysql.Error as e:
-            self.logger.error(f"Database connection error: {e}")
+            self.logger.error("Database connection error: %s", e)
             raise
     
-    def fetch_page(self, url: str, retries: int = 3) -> Optional[BeautifulSoup]:
-        """Fetch and parse a web page with retry logic."""
-        for attempt in range(retries + 1):
-            try:
-                self.logger.info(f"Fetching: {url} (attempt {attempt + 1})")
-                response = self.session.get(url, timeout=30)
-                response.raise_for_status()
-                
-                # Check if we were redirected to a different URL
-                if response.url != url:
-                    self.logger.warning(f"Redirected from {url} to {response.url}")
-                    # If redirected to novel homepage, return None
-                    if '/novel/' in response.url and '/chapter-' not in response.url:
-                        self.logger.warning(f"Redirected to novel homepage, chapter likely doesn't exist")
-                        return None
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                return soup
-                
-            except requests.RequestException as e:
-                self.logger.warning(f"Request failed (attempt {attempt + 1}): {e}")
-                if attempt < retries:
-                    time.sleep(5 * (attempt + 1))  # Exponential backoff
-                else:
-                    self.logger.error(f"Failed to fetch {url} after {retries + 1} attempts")
+    def fetch_response(self, url: str, stream: bool = False,
+                       headers: Optional[Dict[str, str]] = None) -> Optional[requests.Response]:
+        """Fetch a web page; retries and backoff are handled by the session adapter."""
+        try:
+            self.logger.info("Fetching: %s", url)
+            response = self.session.get(url, timeout=30, stream=stream, headers=headers)
+            
+            # urllib3 records any 429/503 responses it retried through (honouring Retry-After)
+            retries = getattr(response.raw, 'retries', None)
+            if retries and any(attempt.status in (429, 503) for attempt in retries.history):
+                self._throttled = True
+            if response.status_code >= 400:
+                # An unread streamed body would otherwise keep its pooled connection
+                response.close()
+            response.raise_for_status()
+            
+            # Check if we were redirected to a different URL
+            if response.url != url:
+                self.logger.warning("Redirected from %s to %s", url, response.url)
+                # If redirected to novel homepage, return None
+                if '/novel/' in response.url and '/chapter-' not in response.url:
+                    self.logger.warning("Redirected to novel homepage, chapter likely doesn't exist")
+                    response.close()
                     return None
+            
+            return response
+            
+        except (requests.exceptions.RetryError, requests.Timeout) as e:
+            self._throttled = True
+            self.logger.error("Failed to fetch %s: %s", url, e)
+            return None
+        except requests.RequestException as e:
+            self.logger.error("Failed to fetch %s: %s", url, e)
+            return None
+    
+    def adjust_delay(self):
+        """After a batch, double the delay between batches if it was throttled, otherwise ease it back down."""
+        with self._rate_lock:
+            throttled, self._throttled = self._throttled, False
+            if throttled:
+                self._delay = min(self._delay * 2, self._max_delay)
+                self.logger.warning("Server is throttling requests, batch delay raised to %.2fs", self._delay)
+            elif self._delay > self._min_delay:
+                self._delay = max(self._min_delay, self._delay * 0.9)
+    
+    def declared_encoding(self, response: requests.Response) -> Optional[str]:
+        """Return the charset from the Content-Type header, or None when the server sent none."""
+        if 'charset=' in response.headers.get('Content-Type', '').lower():
+            return response.encoding
+        return None
+    
+    def fetch_tree(self, url: str) -> Optional[lxml_html.HtmlElement]:
+        """Fetch a page and feed it into an lxml parser as it downloads."""
+        response = self.fetch_response(url, stream=True)
+        if response is None:
+            return None
+        return self.parse_tree(response)
+    
+    def parse_tree(self, response: requests.Response) -> Optional[lxml_html.HtmlElement]:
+        """Parse a response into an lxml tree using its declared charset."""
+        try:
+            parser = lxml_html.HTMLParser(encoding=self.declared_encoding(response))
+            # Streamed bodies are parsed chunk by chunk instead of being buffered into one bytes object
+            for chunk in response.iter_content(chunk_size=16384):
+                parser.feed(chunk)
+            return parser.close()
+        except (requests.RequestException, etree.LxmlError) as e:
+            self.logger.error("Failed to read %s: %s", response.url, e)
+            return None
+        finally:
+            response.close()
+    
+    def element_text(self, element: lxml_html.HtmlElement, separator: str = '', strip: bool = False) -> str:
+        """Join an element's text like BeautifulSoup's get_text(), leaving out script and style."""
+        texts = _TEXT_XPATH(element)
+        if strip:
+            texts = [text.strip() for text in texts]
+            texts = [text for text in texts if text]
+        return separator.join(texts)
+    
+    def build_chapter_page(self, tree: lxml_html.HtmlElement) -> ChapterPage:
+        """Run the page text walk and the title selectors once for a chapter page."""
+        title_element = None
+        for selector in self.ordered_selectors(_TITLE_SELECTORS, self._winning_title_selector):
+            title_elements = selector(tree)
+            if title_elements:
+                title_element = title_elements[0]
+                self._winning_title_selector = selector
+                break
+        return ChapterPage(
+            tree=tree,
+            page_text=self.element_text(tree).lower(),
+            title_element=title_element,
+            content_matches={}
+        )
+    
+    def ordered_selectors(self, selectors: tuple, winner: Optional[CSSSelector]) -> tuple:
+        """Put the selector that matched last time ahead of the fallback list."""
+        if winner is None or selectors[0] is winner or winner not in selectors:
+            return selectors
+        return (winner,) + tuple(selector for selector in selectors if selector is not winner)
+    
+    def select_content(self, page: ChapterPage, selector: CSSSelector) -> list:
+        """Run a content selector on a chapter page, reusing the result if it already ran."""
+        matches = page.content_matches.get(selector)
+        if matches is None:
+            matches = page.content_matches[selector] = selector(page.tree)
+        return matches
+    
+    def first_match(self, selectors: tuple, tree: lxml_html.HtmlElement) -> Optional[lxml_html.HtmlElement]:
+        """Return the first element matched by the first selector that matches anything."""
+        for selector in selectors:
+            elements = selector(tree)
+            if elements:
+                return elements[0]
+        return None
+    
+    def element_string(self, element: lxml_html.HtmlElement) -> Optional[str]:
+        """Return an element's only string, following single children like BeautifulSoup's Tag.string."""
+        while len(element) == 1 and not element.text and not element[0].tail:
+            element = element[0]
+        return element.text if len(element) == 0 else None
     
     def scrape_novel_info(self, novel_slug: str) -> Optional[Dict[str, Any]]:
         """Scrape novel information from the novel's main page."""
         novel_url = f"{self.base_url}/novel/{novel_slug}"
-        soup = self.fetch_page(novel_url)
         
-        if not soup:
+        # Revalidate the info extracted last time instead of downloading and parsing the page again
+        cached = self.http_cache.get(('novel', novel_url)) if self.http_cache is not None else None
+        headers = {}
+        if cached:
+            if cached['etag']:
+                headers['If-None-Match'] = cached['etag']
+            if cached['last_modified']:
+                headers['If-Modified-Since'] = cached['last_modified']
+        
+        response = self.fetch_response(novel_url, headers=headers)
+        
+        if response is None:
+            return None
+        if response.status_code == 304 and cached:
+            self.logger.info("Novel page not modified, using cached info for %s", novel_slug)
+            return cached['novel_info']
+        tree = self.parse_tree(response)
+        if tree is None:
             return None
         
         novel_info = {
@@ -123,9 +399,11 @@ class WuxiaworldSiteScraper:
         
         try:
             # Extract title from h1 or title tag
-            title_element = soup.find('h1') or soup.find('title')
-            if title_element:
-                title_text = title_element.get_text(strip=True)
+            title_element = tree.find('.//h1')
+            if title_element is None:
+                title_element = tree.find('.//title')
+            if title_element is not None:
+                title_text = self.element_text(title_element, strip=True)
                 # Clean up title if it contains site name
                 if ' - ' in title_text:
                     novel_info['title'] = title_text.split(' - ')[0].strip()
@@ -133,42 +411,42 @@ class WuxiaworldSiteScraper:
                     novel_info['title'] = title_text
             
             # Extract author - look for various patterns specific to wuxiaworld.site
-            author_element = None
+            # Try to find "Author(s)" section, first straight from the page bytes
+            author_match = _AUTHOR_RE.search(response.content)
+            if author_match:
+                author_name = author_match.group(1).decode(self.declared_encoding(response) or 'utf-8', 'replace')
+                novel_info['author'] = html.unescape(author_name).strip() or None
             
-            # Try to find "Author(s)" section
-            author_heading = soup.find(string=lambda text: text and 'Author(s)' in text)
-            if author_heading:
+            author_heading = None
+            if not novel_info['author']:
+                author_heading = next((text for text in _ALL_TEXT_XPATH(tree) if 'Author(s)' in text), None)
+            if author_heading is not None:
                 # Find the next sibling that contains the author link/text
-                current = author_heading.parent
-                while current:
-                    next_elem = current.find_next_sibling()
-                    if next_elem:
-                        author_link = next_elem.find('a')
-                        if author_link:
-                            novel_info['author'] = author_link.get_text(strip=True)
+                current = author_heading.getparent()
+                if author_heading.is_tail:
+                    current = current.getparent()
+                while current is not None:
+                    next_elem = next((sibling for sibling in current.itersiblings()
+                                      if isinstance(sibling.tag, str)), None)
+                    if next_elem is not None:
+                        author_link = next_elem.find('.//a')
+                        if author_link is not None:
+                            novel_info['author'] = self.element_text(author_link, strip=True)
                             break
-                        elif next_elem.get_text(strip=True):
-                            novel_info['author'] = next_elem.get_text(strip=True)
+                        elif self.element_text(next_elem, strip=True):
+                            novel_info['author'] = self.element_text(next_elem, strip=True)
                             break
                     current = next_elem
             
             # Fallback to other patterns if author not found
             if not novel_info['author']:
-                author_selectors = [
-                    'span.author',
-                    'div.author',
-                    '.novel-author',
-                    '.author-name'
-                ]
-                for selector in author_selectors:
-                    author_element = soup.select_one(selector)
-                    if author_element:
-                        novel_info['author'] = author_element.get_text(strip=True)
-                        break
+                author_element = self.first_match(_AUTHOR_SELECTORS, tree)
+                if author_element is not None:
+                    novel_info['author'] = self.element_text(author_element, strip=True)
                 
                 # Try to find text containing "Author:"
                 if not novel_info['author']:
-                    author_text_elem = soup.find(string=lambda x: x and 'Author:' in x)
+                    author_text_elem = next((text for text in _ALL_TEXT_XPATH(tree) if 'Author:' in text), None)
                     if author_text_elem:
                         author_text = author_text_elem.strip()
                         if ':' in author_text:
@@ -177,142 +455,92 @@ class WuxiaworldSiteScraper:
                             novel_info['author'] = author_text.strip()
             
             # Extract description - look for meta description or content divs
-            desc_meta = soup.find('meta', attrs={'name': 'description'})
-            if desc_meta and desc_meta.get('content'):
-                novel_info['description'] = desc_meta.get('content').strip()
+            desc_metas = _META_DESCRIPTION_XPATH(tree)
+            if desc_metas and desc_metas[0].get('content'):
+                novel_info['description'] = desc_metas[0].get('content').strip()
             else:
                 # Look for description in content
-                desc_selectors = [
-                    'div.summary',
-                    'div.description', 
-                    'div.novel-description',
-                    'div.content p',
-                    '.entry-content p'
-                ]
-                for selector in desc_selectors:
-                    desc_element = soup.select_one(selector)
-                    if desc_element and desc_element.get_text(strip=True):
-                        novel_info['description'] = desc_element.get_text(strip=True)
+                for selector in _DESCRIPTION_SELECTORS:
+                    desc_elements = selector(tree)
+                    if desc_elements and self.element_text(desc_elements[0], strip=True):
+                        novel_info['description'] = self.element_text(desc_elements[0], strip=True)
                         break
             
             # Extract cover image - enhanced for wuxiaworld.site
-            cover_selectors = [
-                'img.cover',
-                'img.novel-cover',
-                'div.cover img',
-                'div.novel-image img',
-                'img[alt*="cover"]',
-                'img[src*="cover"]',
-                '.summary-image img',
-                '.novel-thumbnail img',
-                '.wp-post-image'
-            ]
-            
-            for selector in cover_selectors:
-                cover_element = soup.select_one(selector)
-                if cover_element and cover_element.get('src'):
-                    cover_url = cover_element.get('src')
-                    # Handle different URL formats
-                    if cover_url.startswith('//'):
-                        cover_url = 'https:' + cover_url
-                    elif cover_url.startswith('/'):
-                        cover_url = self.base_url + cover_url
-                    elif not cover_url.startswith('http'):
-                        cover_url = self.base_url + '/' + cover_url
-                    novel_info['cover_image'] = cover_url
+            for selector in _COVER_SELECTORS:
+                cover_elements = selector(tree)
+                if cover_elements and cover_elements[0].get('src'):
+                    novel_info['cover_image'] = self.absolutize_url(cover_elements[0].get('src'))
                     break
             
-            # Additional cover image search - look for any img near the title
+            # Additional cover image search - images whose src looks like a cover
             if not novel_info['cover_image']:
-                # Find images that might be cover images based on size or position
-                all_images = soup.find_all('img')
-                for img in all_images:
+                for img in _COVER_FALLBACK_XPATH(tree, slug=novel_slug):
                     src = img.get('src', '')
-                    alt = img.get('alt', '')
-                    
                     # Skip small images, logos, icons
-                    if any(skip in src.lower() for skip in ['icon', 'logo', 'avatar', 'ad', 'banner']):
-                        continue
-                    if any(skip in alt.lower() for skip in ['icon', 'logo', 'avatar', 'ad', 'banner']):
+                    if _SKIP_IMG_RE.search(f"{src}|{img.get('alt', '')}"):
                         continue
-                    
-                    # Look for images that might be covers
-                    if src and (
-                        'upload' in src.lower() or 
-                        'thumb' in src.lower() or
-                        'cover' in src.lower() or
-                        novel_slug in src.lower()
-                    ):
-                        cover_url = src
-                        if cover_url.startswith('//'):
-                            cover_url = 'https:' + cover_url
-                        elif cover_url.startswith('/'):
-                            cover_url = self.base_url + cover_url
-                        elif not cover_url.startswith('http'):
-                            cover_url = self.base_url + '/' + cover_url
-                        novel_info['cover_image'] = cover_url
-                        break
+                    novel_info['cover_image'] = self.absolutize_url(src)
+                    break
             
             # Extract chapter links to determine total chapters
-            chapter_links = soup.find_all('a', href=lambda x: x and '/chapter-' in x)
+            chapter_links = _CHAPTER_HREF_XPATH(tree)
             if not chapter_links:
                 # Alternative patterns for chapter links
-                chapter_links = soup.find_all('a', href=lambda x: x and 'chapter' in x.lower())
+                chapter_links = _ANY_CHAPTER_HREF_XPATH(tree)
             
             novel_info['total_chapters'] = len(chapter_links)
+            # Chapter URLs by number, so scraping can follow the listing instead of probing;
+            # only a chapter-list container counts as the complete table of contents
+            listed_links = [link.get('href') for link in _CHAPTER_LIST_SELECTOR(tree) if link.get('href')]
+            novel_info['chapter_urls'] = self.chapter_index(listed_links or chapter_links, novel_slug)
+            novel_info['chapter_list_complete'] = bool(listed_links) and bool(novel_info['chapter_urls'])
             
             # Extract genres if available
-            genre_selectors = [
-                '.genres a',
-                '.genre-tags a', 
-                '.tags a',
-                'span.genre'
-            ]
-            for selector in genre_selectors:
-                genre_elements = soup.select(selector)
+            for selector in _GENRE_SELECTORS:
+                genre_elements = selector(tree)
                 if genre_elements:
-                    novel_info['genres'] = [elem.get_text(strip=True) for elem in genre_elements]
+                    novel_info['genres'] = [self.element_text(elem, strip=True) for elem in genre_elements]
                     break
             
             # Try to determine status
-            status_selectors = [
-                '.status',
-                '.novel-status',
-                'span.completed',
-                'span.ongoing'
-            ]
-            for selector in status_selectors:
-                status_element = soup.select_one(selector)
-                if status_element:
-                    status_text = status_element.get_text(strip=True).lower()
-                    if 'completed' in status_text or 'finished' in status_text:
-                        novel_info['status'] = 'completed'
-                    elif 'hiatus' in status_text or 'paused' in status_text:
-                        novel_info['status'] = 'hiatus'
-                    break
+            status_element = self.first_match(_STATUS_SELECTORS, tree)
+            if status_element is not None:
+                status_text = self.element_text(status_element, strip=True).lower()
+                if 'completed' in status_text or 'finished' in status_text:
+                    novel_info['status'] = 'completed'
+                elif 'hiatus' in status_text or 'paused' in status_text:
+                    novel_info['status'] = 'hiatus'
             
-            self.logger.info(f"Novel info extracted: {novel_info['title']} by {novel_info['author']}")
+            self.logger.info("Novel info extracted: %s by %s", novel_info['title'], novel_info['author'])
+            
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if (etag or last_modified) and self.http_cache is not None:
+                self.http_cache.set(('novel', novel_url), {
+                    'etag': etag,
+                    'last_modified': last_modified,
+                    'novel_info': novel_info
+                })
             return novel_info
             
         except Exception as e:
-            self.logger.error(f"Error extracting novel info: {e}")
+            self.logger.error("Error extracting novel info: %s", e)
             return None
     
     def get_or_create_novel(self, novel_info: Dict[str, Any]) -> Optional[int]:
         """Get or create novel in database and return novel_id."""
-        cursor = self.db_connection.cursor()
-        
         try:
             # Check if novel exists by slug
-            cursor.execute("SELECT id FROM novels WHERE slug = %s", (novel_info['slug'],))
-            result = cursor.fetchone()
+            self.cursor.execute("SELECT id FROM novels WHERE slug = %s", (novel_info['slug'],))
+            result = self.cursor.fetchone()
             
             if result:
                 novel_id = result[0]
-                self.logger.info(f"Found existing novel with ID: {novel_id}")
+                self.logger.info("Found existing novel with ID: %s", novel_id)
                 
                 # Update the novel with new information
-                cursor.execute("""
+                self.cursor.execute("""
                     UPDATE novels SET 
                         title = %s, author = %s, description = %s, cover_image = %s, 
                         total_chapters = %s, status = %s, updated_at = NOW()
@@ -323,10 +551,10 @@ class WuxiaworldSiteScraper:
                     novel_info['status'], novel_id
                 ))
                 self.db_connection.commit()
-                self.logger.info(f"Updated existing novel: {novel_info['title']}")
+                self.logger.info("Updated existing novel: %s", novel_info['title'])
             else:
                 # Create new novel
-                cursor.execute("""
+                self.cursor.execute("""
                     INSERT INTO novels (title, slug, author, description, cover_image, 
                                       total_chapters, status, created_at, updated_at) 
                     VALUES (%s, %s, %s, %s, %s, %s, %s, NOW(), NOW())
@@ -336,101 +564,113 @@ class WuxiaworldSiteScraper:
                     novel_info['total_chapters'], novel_info['status']
                 ))
                 self.db_connection.commit()
-                novel_id = cursor.lastrowid
-                self.logger.info(f"Created new novel with ID: {novel_id}")
+                novel_id = self.cursor.lastrowid
+                self.logger.info("Created new novel with ID: %s", novel_id)
             
             return novel_id
             
         except pymysql.Error as e:
-            self.logger.error(f"Database error managing novel: {e}")
+            self.logger.error("Database error managing novel: %s", e)
             return None
-        finally:
-            cursor.close()
+    
+    def absolutize_url(self, url: str) -> str:
+        """Turn a protocol-relative or site-relative URL into an absolute one."""
+        if url.startswith('//'):
+            return 'https:' + url
+        elif url.startswith('/'):
+            return self.base_url + url
+        elif not url.startswith('http'):
+            return self.base_url + '/' + url
+        return url
+    
+    def chapter_number_from_url(self, url: str) -> Optional[int]:
+        """Return the chapter number in a chapter URL, or None when it has none."""
+        # Chapter URLs end in chapter-<n>/, so slicing after the last "chapter-" usually does it
+        tail = url.rpartition('chapter-')[2].partition('/')[0]
+        if tail.isdecimal():
+            return int(tail)
+        match = _CHAPTER_NUM_RE.search(url)
+        return int(match.group(1)) if match else None
+    
+    def chapter_index(self, hrefs: List[str], novel_slug: str) -> Dict[int, str]:
+        """Map chapter numbers to absolute URLs for a novel page's links to its own chapters."""
+        marker = f"/novel/{novel_slug}/chapter-"
+        index = {}
+        for href in hrefs:
+            if marker not in href:
+                continue
+            number = self.chapter_number_from_url(href)
+            if number is not None:
+                index.setdefault(number, self.absolutize_url(href))
+        return index
+    
+    def chapter_url_prefix(self, novel_slug: str) -> str:
+        """Build the part of a chapter URL that precedes the chapter number."""
+        return f"{self.base_url}/novel/{novel_slug}/chapter-"
     
     def build_chapter_url(self, novel_slug: str, chapter_number: int) -> str:
         """Build chapter URL from pattern."""
-        return f"{self.base_url}/novel/{novel_slug}/chapter-{chapter_number}/"
+        return self.chapter_url_prefix(novel_slug) + str(chapter_number) + '/'
     
-    def extract_chapter_data(self, soup: BeautifulSoup, chapter_number: int) -> Optional[Dict[str, Any]]:
+    def extract_chapter_data(self, page: ChapterPage, chapter_number: int) -> Optional[ChapterData]:
         """Extract chapter data from parsed HTML with wuxiaworld.site specific formatting."""
         try:
             # First check if this is actually a chapter page
-            page_text = soup.get_text().lower()
+            page_text = page.page_text
             if 'summary' in page_text and 'author(s)' in page_text and 'genre(s)' in page_text:
-                self.logger.warning(f"Chapter {chapter_number} page appears to be novel homepage, skipping")
+                self.logger.warning("Chapter %s page appears to be novel homepage, skipping", chapter_number)
                 return None
             
-            chapter_data = {
-                'chapter_number': chapter_number,
-                'title': None,
-                'content': None
-            }
+            chapter_data = ChapterData(chapter_number)
             
             # Extract title - wuxiaworld.site uses various patterns
-            title_selectors = [
-                'h1.entry-title',
-                'h1.chapter-title', 
-                'h1',
-                '.post-title h1',
-                '.chapter-title'
-            ]
-            
-            for selector in title_selectors:
-                title_element = soup.select_one(selector)
-                if title_element:
-                    title_text = title_element.get_text(strip=True)
-                    # Clean up title
-                    title_text = re.sub(r'^Chapter\s*\d+\s*[-:]?\s*', '', title_text, flags=re.IGNORECASE)
-                    chapter_data['title'] = title_text
-                    break
+            if page.title_element is not None:
+                title_text = self.element_text(page.title_element, strip=True)
+                # Clean up title; most titles have no "Chapter N" prefix, so test the literal first
+                if title_text[:7].lower() == 'chapter':
+                    title_text = _CHAPTER_PREFIX_RE.sub('', title_text)
+                chapter_data.title = title_text
             
             # If no title found from HTML elements, set a default title
-            if not chapter_data['title']:
-                chapter_data['title'] = f"Chapter {chapter_number}"
+            if not chapter_data.title:
+                chapter_data.title = f"Chapter {chapter_number}"
             
             # Extract content - wuxiaworld.site specific selectors
-            content_selectors = [
-                '.entry-content',
-                '.post-content',
-                '.chapter-content',
-                '.content',
-                '#content',
-                '.post-body'
-            ]
-            
             content_element = None
-            for selector in content_selectors:
-                content_element = soup.select_one(selector)
-                if content_element:
+            for selector in self.ordered_selectors(_CONTENT_SELECTORS, self._winning_content_selector):
+                content_elements = self.select_content(page, selector)
+                if content_elements:
+                    content_element = content_elements[0]
+                    self._winning_content_selector = selector
                     break
             
-            if content_element:
+            if content_element is not None:
                 # Remove unwanted elements
-                for unwanted in content_element.find_all([
-                    'script', 'style', 'nav', 'footer', 'header', 
-                    '.navigation', '.nav', '.prev-next', 
-                    '.chapter-nav', '.ads', '.advertisement'
-                ]):
-                    unwanted.decompose()
+                for unwanted in _UNWANTED_SELECTOR(content_element):
+                    if unwanted is not content_element:
+                        unwanted.drop_tree()
                 
                 # Remove navigation elements with "Next" or "Previous" text
-                for nav_elem in content_element.find_all(['a', 'div', 'span'], 
-                                                       string=lambda x: x and ('next' in x.lower() or 'previous' in x.lower() or 'prev' in x.lower())):
-                    nav_elem.decompose()
+                for nav_elem in list(content_element.iter('a', 'div', 'span')):
+                    nav_text = self.element_string(nav_elem)
+                    if not nav_text:
+                        continue
+                    lowered = nav_text.lower()
+                    if ('next' in lowered or 'prev' in lowered) and _NAV_TEXT_RE.search(nav_text):
+                        nav_elem.drop_tree()
                 
                 # Convert br tags to line breaks
-                for br in content_element.find_all('br'):
-                    br.replace_with('\n')
+                for br in content_element.iter('br'):
+                    br.tail = '\n' + (br.tail or '')
                 
                 # Get text content
-                content_text = content_element.get_text(separator='\n')
+                content_text = self.element_text(content_element, separator='\n')
                 
                 # Process markdown-style headers (### Chapter X, ### Prologue)
-                lines = content_text.split('\n')
                 processed_lines = []
                 chapter_found = False
                 
-                for line in lines:
+                for line in content_text.splitlines():
                     line = line.strip()
                     if not line:
                         if processed_lines and processed_lines[-1]:  # Only add if previous line has content
@@ -440,101 +680,91 @@ class WuxiaworldSiteScraper:
                     # Check for markdown headers
                     if line.startswith('###'):
                         header_text = line.replace('###', '').strip()
-                        if re.match(r'(chapter\s*\d+|prologue|epilogue)', header_text, re.IGNORECASE):
+                        if _HEADER_RE.match(header_text):
                             chapter_found = True
                             # Use this header as title if we don't have one yet
-                            if not chapter_data['title'] or chapter_data['title'] == f"Chapter {chapter_number}":
-                                chapter_data['title'] = header_text
+                            if not chapter_data.title or chapter_data.title == f"Chapter {chapter_number}":
+                                chapter_data.title = header_text
                             processed_lines.append(f"\n=== {header_text} ===\n")
                             continue
                     
                     # Skip navigation text
-                    if re.match(r'^\[\s*(next|previous|prev)\s*\]', line, re.IGNORECASE):
+                    if line.startswith('[') and _NAV_LINE_RE.match(line):
                         continue
                     
                     # Skip if line is just navigation or metadata
-                    if any(skip_text in line.lower() for skip_text in [
-                        'table of contents', 'next chapter', 'previous chapter',
-                        'click here', 'read more', 'subscribe', 'donate'
-                    ]):
+                    if _SKIP_LINE_RE.search(line):
                         continue
                     
                     processed_lines.append(line)
                 
                 # Join and clean content
                 content = '\n'.join(processed_lines)
-                content = re.sub(r'\n\s*\n\s*\n+', '\n\n', content)  # Normalize multiple line breaks
+                content = _MULTI_NL_RE.sub('\n\n', content)  # Normalize multiple line breaks
                 content = content.strip()
                 
+                # Split once; the checks below, the saved row and the progress totals all reuse it
+                word_count = len(content.split())
+                
                 # Ensure we have actual chapter content
-                if content and len(content.split()) > 20:  # Minimum word count threshold
+                if word_count > 20:  # Minimum word count threshold
                     # Additional validation - check if content looks like a novel summary
                     content_lower = content.lower()
-                    summary_indicators = ['summary', 'author(s)', 'genre(s)', 'alternative', 'rating', 'status']
-                    summary_count = sum(1 for indicator in summary_indicators if indicator in content_lower)
+                    summary_count = sum(1 for indicator in _SUMMARY_INDICATORS if indicator in content_lower)
                     
                     if summary_count >= 3:
-                        self.logger.warning(f"Chapter {chapter_number} content appears to be novel summary, not chapter content")
+                        self.logger.warning("Chapter %s content appears to be novel summary, not chapter content", chapter_number)
                         return None
                     
                     # Check if content has actual story elements (dialogue, narrative)
-                    story_indicators = ['"', '"', '"', 'he said', 'she said', 'thought', 'looked', 'walked']
-                    story_count = sum(1 for indicator in story_indicators if indicator in content_lower)
+                    story_count = sum(1 for indicator in _STORY_INDICATORS if indicator in content_lower)
                     
-                    if story_count == 0 and len(content.split()) < 200:
-                        self.logger.warning(f"Chapter {chapter_number} content doesn't appear to be story content")
+                    if story_count == 0 and word_count < 200:
+                        self.logger.warning("Chapter %s content doesn't appear to be story content", chapter_number)
                         return None
                     
-                    chapter_data['content'] = content
+                    chapter_data.content = content
+                    chapter_data.word_count = word_count
                 else:
-                    self.logger.warning(f"Chapter {chapter_number} content too short or empty")
+                    self.logger.warning("Chapter %s content too short or empty", chapter_number)
                     return None
             
             # Final check: ensure we have a title
-            if not chapter_data['title']:
-                chapter_data['title'] = f"Chapter {chapter_number}"
+            if not chapter_data.title:
+                chapter_data.title = f"Chapter {chapter_number}"
             
-            if not chapter_data['content']:
-                self.logger.warning(f"No content found for chapter {chapter_number}")
+            if not chapter_data.content:
+                self.logger.warning("No content found for chapter %s", chapter_number)
                 return None
                 
             return chapter_data
             
         except Exception as e:
-            self.logger.error(f"Error extracting chapter {chapter_number}: {e}")
+            self.logger.error("Error extracting chapter %s: %s", chapter_number, e)
             return None
     
-    def get_next_chapter_url(self, soup: BeautifulSoup, current_url: str) -> Optional[str]:
+    def get_next_chapter_url(self, tree: lxml_html.HtmlElement, current_url: str) -> Optional[str]:
         """Extract the next chapter URL from the current page."""
         try:
-            # Look for next chapter links with various patterns
-            next_selectors = [
-                'a[href*="chapter-"]:contains("Next")',
-                'a.next-chapter',
-                'a.next',
-                '.chapter-nav a[href*="chapter-"]',
-                '.navigation a[href*="chapter-"]'
-            ]
-            
-            # Find links containing "next" text
-            next_links = soup.find_all('a', string=lambda x: x and 'next' in x.lower())
-            for link in next_links:
+            # Find chapter links containing "next" text
+            for link in _CHAPTER_LINK_SELECTOR(tree):
+                link_string = self.element_string(link)
+                if not link_string or 'next' not in link_string.lower():
+                    continue
                 href = link.get('href')
-                if href and 'chapter-' in href:
-                    if href.startswith('/'):
-                        return self.base_url + href
-                    elif href.startswith('http'):
-                        return href
+                if href.startswith('/'):
+                    return self.base_url + href
+                elif href.startswith('http'):
+                    return href
             
             # Look for navigation patterns specific to wuxiaworld.site
-            nav_divs = soup.find_all(['div', 'nav'], class_=lambda x: x and any(
-                nav_class in x.lower() for nav_class in ['nav', 'chapter', 'next', 'pagination']
-            ))
+            nav_divs = [element for element in tree.iter('div', 'nav')
+                        if _NAV_CLASS_RE.search(element.get('class', ''))]
             
             for nav_div in nav_divs:
-                next_links = nav_div.find_all('a', href=lambda x: x and 'chapter-' in x)
+                next_links = [link for link in nav_div.iter('a') if 'chapter-' in link.get('href', '')]
                 for link in next_links:
-                    link_text = link.get_text(strip=True).lower()
+                    link_text = self.element_text(link, strip=True).lower()
                     if 'next' in link_text:
                         href = link.get('href')
                         if href.startswith('/'):
@@ -545,10 +775,10 @@ class WuxiaworldSiteScraper:
             return None
             
         except Exception as e:
-            self.logger.error(f"Error finding next chapter URL: {e}")
+            self.logger.error("Error finding next chapter URL: %s", e)
             return None
     
-    def is_actual_chapter_page(self, soup: BeautifulSoup, current_url: str, novel_slug: str, chapter_number: int) -> bool:
+    def is_actual_chapter_page(self, page: ChapterPage, current_url: str, novel_slug: str, chapter_number: int) -> bool:
         """Check if we're actually on a chapter page or redirected to novel homepage."""
         try:
             # Check if URL contains the expected chapter pattern
@@ -556,60 +786,45 @@ class WuxiaworldSiteScraper:
             if expected_chapter_pattern not in current_url:
                 return False
             
-            # Check for novel homepage indicators
-            novel_homepage_indicators = [
-                'div.summary',  # Summary section on novel page
-                'div.novel-info',  # Novel info section
-                '.author-info',  # Author info
-                '.genre-tags',  # Genre tags
-                'h2:contains("Summary")',  # Summary heading
-                'h2:contains("SUMMARY")',  # Summary heading uppercase
-                '.rating',  # Rating section
-                '.novel-status'  # Status section
-            ]
+            tree = page.tree
+            page_text = page.page_text
             
-            for indicator in novel_homepage_indicators:
-                if soup.select_one(indicator):
-                    self.logger.debug(f"Found novel homepage indicator: {indicator}")
+            # Check for novel homepage indicators
+            for indicator in _HOMEPAGE_SELECTORS:
+                if indicator(tree):
+                    self.logger.debug("Found novel homepage indicator: %s", indicator.css)
                     return False
             
-            # Check for specific text that indicates we're on novel homepage
-            page_text = soup.get_text().lower()
-            homepage_text_indicators = [
-                'summary',
-                'author(s)',
-                'genre(s)',
-                'alternative',
-                'status',
-                'rating'
-            ]
-            
             # If we find multiple homepage indicators, likely not a chapter page
-            found_indicators = sum(1 for indicator in homepage_text_indicators if indicator in page_text)
+            found_indicators = sum(1 for indicator in _SUMMARY_INDICATORS if indicator in page_text)
             if found_indicators >= 3:
-                self.logger.debug(f"Found {found_indicators} homepage text indicators")
+                self.logger.debug("Found %s homepage text indicators", found_indicators)
                 return False
             
-            # Check if we have actual chapter content patterns
-            chapter_content_indicators = [
-                # Look for chapter headers in the content
-                soup.find(string=lambda x: x and re.match(r'###\s*(chapter\s*\d+|prologue|epilogue)', x, re.IGNORECASE)),
-                # Look for "Next" navigation specific to chapters
-                soup.find('a', string=lambda x: x and 'next' in x.lower() and 'chapter' in soup.get_text().lower()),
+            # Chapter containers, starting with the one that held the previous chapter
+            content_selectors = self.ordered_selectors(_CONTENT_SELECTORS[:4], self._winning_content_selector)
+            
+            # Check if we have actual chapter content patterns, cheapest first so the
+            # full-page walks only run when no chapter-specific container matched
+            has_chapter_indicator = (
                 # Look for chapter-specific content selectors
-                soup.select_one('.entry-content'),
-                soup.select_one('.post-content'),
-                soup.select_one('.chapter-content')
-            ]
+                any(self.select_content(page, selector) for selector in content_selectors
+                    if selector is not _CONTENT_SELECTORS[3])
+                # Look for "Next" navigation specific to chapters
+                or ('chapter' in page_text and any('next' in (self.element_string(link) or '').lower()
+                                                   for link in tree.iter('a')))
+                # Look for chapter headers in the content
+                or any(text.startswith('###') and _MARKDOWN_HEADER_RE.match(text)
+                       for text in _ALL_TEXT_XPATH(tree))
+            )
             
             # If we have chapter content indicators, it's likely a chapter page
-            if any(chapter_content_indicators):
+            if has_chapter_indicator:
                 # Double-check by looking for substantial text content
-                content_selectors = ['.entry-content', '.post-content', '.chapter-content', '.content']
                 for selector in content_selectors:
-                    content_elem = soup.select_one(selector)
-                    if content_elem:
-                        content_text = content_elem.get_text(strip=True)
+                    content_elems = self.select_content(page, selector)
+                    if content_elems:
+                        content_text = self.element_text(content_elems[0], strip=True)
                         # If content is substantial and contains story-like text, it's likely a chapter
                         if len(content_text.split()) > 100:
                             return True
@@ -618,198 +833,325 @@ class WuxiaworldSiteScraper:
             return False
             
         except Exception as e:
-            self.logger.error(f"Error checking if page is actual chapter: {e}")
+            self.logger.error("Error checking if page is actual chapter: %s", e)
             # In case of error, assume it's not a chapter page to be safe
             return False
 
-    def chapter_exists_in_db(self, novel_id: int, chapter_number: int) -> bool:
-        """Check if chapter already exists in database."""
-        cursor = self.db_connection.cursor()
+    def set_bulk_load_mode(self, enabled: bool):
+        """Toggle session-level foreign key checks off for bulk chapter loads, or back on."""
+        # unique_checks stays on: ON DUPLICATE KEY relies on unique_chapter to skip stored rows
+        value = 0 if enabled else 1
         try:
-            cursor.execute(
-                "SELECT id FROM chapters WHERE novel_id = %s AND chapter_number = %s",
-                (novel_id, chapter_number)
-            )
-            return cursor.fetchone() is not None
+            self.cursor.execute(f"SET SESSION foreign_key_checks = {value}")
+            self.logger.info("Bulk load mode %s", 'enabled' if enabled else 'disabled')
         except pymysql.Error as e:
-            self.logger.error(f"Database error checking chapter existence: {e}")
-            return False
-        finally:
-            cursor.close()
+            self.logger.warning("Could not change bulk load session settings: %s", e)
+    
+    def get_existing_chapter_numbers(self, novel_id: int) -> set:
+        """Return the numbers of all chapters of a novel that already exist in database."""
+        try:
+            self.cursor.execute("SELECT chapter_number FROM chapters WHERE novel_id = %s", (novel_id,))
+            return {row[0] for row in self.cursor.fetchall()}
+        except pymysql.Error as e:
+            self.logger.error("Database error loading existing chapters: %s", e)
+            return set()
+    
+    def save_chapter(self, novel_id: int, chapter_data: ChapterData) -> bool:
+        """Queue chapter for the next batched insert."""
+        self._pending_chapters.append((
+            novel_id,
+            chapter_data.chapter_number,
+            chapter_data.title or '',
+            chapter_data.content or '',
+            chapter_data.word_count
+        ))
+        self.logger.info("Chapter %s queued - %s words", chapter_data.chapter_number, chapter_data.word_count)
+        return True
+    
+    def split_rows_by_size(self, rows: List[tuple]) -> List[List[tuple]]:
+        """Group chapter rows so each INSERT statement stays under max_allowed_packet."""
+        groups = []
+        current = []
+        current_size = 0
+        for row in rows:
+            row_size = len(row[3].encode('utf-8')) + len((row[2] or '').encode('utf-8'))
+            if current and current_size + row_size > _MAX_INSERT_BYTES:
+                groups.append(current)
+                current = []
+                current_size = 0
+            current.append(row)
+            current_size += row_size
+        if current:
+            groups.append(current)
+        return groups
     
-    def save_chapter(self, novel_id: int, chapter_data: Dict[str, Any]) -> bool:
-        """Save chapter to database."""
-        cursor = self.db_connection.cursor()
+    def flush_chapters(self) -> bool:
+        """Insert all queued chapters with multi-row INSERTs and a single commit; they stay queued if it fails."""
+        if not self._pending_chapters:
+            return True
+        
         try:
-            # Calculate word count
-            content = chapter_data.get('content', '')
-            word_count = len(content.split()) if content else 0
-            
-            cursor.execute(
-                """INSERT INTO chapters (novel_id, chapter_number, title, content, word_count, created_at, updated_at) 
-                   VALUES (%s, %s, %s, %s, %s, NOW(), NOW())""",
-                (
-                    novel_id,
-                    chapter_data['chapter_number'],
-                    chapter_data.get('title', ''),
-                    content,
-                    word_count
+            # One multi-row INSERT per packet-sized group of chapters
+            for rows in self.split_rows_by_size(self._pending_chapters):
+                self.cursor.execute(
+                    _CHAPTER_INSERT_SQL
+                    + ", ".join([_CHAPTER_ROW_PLACEHOLDER] * len(rows))
+                    + _CHAPTER_INSERT_SUFFIX,
+                    [value for row in rows for value in row]
                 )
-            )
             self.db_connection.commit()
-            
-            self.logger.info(f"Chapter {chapter_data['chapter_number']} saved - {word_count} words")
-            return True
         except pymysql.Error as e:
-            self.logger.error(f"Database error saving chapter {chapter_data['chapter_number']}: {e}")
+            self.db_connection.rollback()
+            self.logger.error("Database error saving chapters %s-%s, keeping them for the next attempt: %s",
+                              self._pending_chapters[0][1], self._pending_chapters[-1][1], e)
             return False
-        finally:
-            cursor.close()
+        
+        self._saved_chapters += len(self._pending_chapters)
+        self._saved_words += sum(row[4] for row in self._pending_chapters)
+        self.logger.info("Saved %d chapters to database", len(self._pending_chapters))
+        self._pending_chapters.clear()
+        return True
+    
+    def fetch_chapter_page(self, url: str, novel_slug: str, chapter_number: int) -> Optional[ChapterPage]:
+        """Fetch a chapter page, returning None when it is missing or is not really a chapter."""
+        tree = self.fetch_tree(url)
+        if tree is None:
+            return None
+        
+        # Walk the page once; the chapter check and the extractor both read from it
+        page = self.build_chapter_page(tree)
+        
+        # Check if we're actually on a chapter page or redirected to novel homepage
+        if not self.is_actual_chapter_page(page, url, novel_slug, chapter_number):
+            self.logger.warning("Chapter %s not found - redirected to novel homepage or invalid page", chapter_number)
+            return None
+        return page
     
     def scrape_chapters(self, novel_slug: str, novel_id: int, start_chapter: int = 1, 
-                       end_chapter: Optional[int] = None, skip_existing: bool = True):
-        """Scrape chapters using next button navigation."""
-        self.logger.info(f"Starting chapter scraping from chapter {start_chapter}")
+                       end_chapter: Optional[int] = None, skip_existing: bool = True,
+                       chapter_urls: Optional[Dict[int, str]] = None,
+                       chapter_list_complete: bool = False) -> Optional[int]:
+        """Scrape chapters in concurrently fetched batches, downloading one batch while the previous is saved.
         
-        # Build first chapter URL
-        current_url = self.build_chapter_url(novel_slug, start_chapter)
+        chapter_urls is the novel page's chapter listing. Numbers missing from it are only left out
+        when chapter_list_complete says it is the full table of contents; otherwise they, like the
+        chapters past its end, are found by URL pattern as usual.
+        Returns the novel's total number of stored chapters, or None when it isn't known without a COUNT.
+        """
+        self.logger.info("Starting chapter scraping from chapter %s (%d concurrent requests)",
+                         start_chapter, self.concurrency)
+        
+        url_prefix = self.chapter_url_prefix(novel_slug)
         chapter_number = start_chapter
         consecutive_failures = 0
         max_consecutive_failures = 5
-        chapters_scraped = 0
-        total_words = 0
+        # Only chapters committed to the database count as scraped
+        self._saved_chapters = 0
+        self._saved_words = 0
+        # One query up front; skipping is a set lookup from then on
+        existing_chapters = self.get_existing_chapter_numbers(novel_id) if skip_existing else set()
+        chapter_urls = chapter_urls or {}
+        first_listed = min(chapter_urls, default=0)
+        last_listed = max(chapter_urls, default=0)
+        if chapter_urls:
+            self.logger.info("Novel page lists %d chapters (%s-%s)%s", len(chapter_urls), first_listed, last_listed,
+                             '' if chapter_list_complete else ', probing unlisted numbers')
+        unlisted_skipped = 0
+        next_url = None  # Next link of the last chapter scraped
+        next_number = None  # Chapter number that link points to
+        stop = False
+        
+        pending = []  # (chapter number, url, future) for the batch currently downloading
+        last_attempted = None  # Highest chapter actually processed; batches are fetched ahead of it
+        last_submit = 0.0
         
-        while current_url and (not end_chapter or chapter_number <= end_chapter):
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
             try:
-                # Check if chapter already exists
-                if skip_existing and self.chapter_exists_in_db(novel_id, chapter_number):
-                    self.logger.info(f"Chapter {chapter_number} already exists, skipping")
-                    chapter_number += 1
-                    current_url = self.build_chapter_url(novel_slug, chapter_number)
-                    continue
-                
-                # Fetch chapter page
-                soup = self.fetch_page(current_url)
-                if not soup:
-                    consecutive_failures += 1
-                    if consecutive_failures >= max_consecutive_failures:
-                        self.logger.error(f"Too many consecutive failures, stopping")
-                        break
-                    chapter_number += 1
-                    current_url = self.build_chapter_url(novel_slug, chapter_number)
-                    continue
-                
-                # Check if we're actually on a chapter page or redirected to novel homepage
-                is_chapter_page = self.is_actual_chapter_page(soup, current_url, novel_slug, chapter_number)
-                
-                if not is_chapter_page:
-                    self.logger.warning(f"Chapter {chapter_number} not found - redirected to novel homepage or invalid page")
-                    consecutive_failures += 1
-                    if consecutive_failures >= max_consecutive_failures:
-                        self.logger.error(f"Too many consecutive failures, stopping")
-                        break
-                    chapter_number += 1
-                    current_url = self.build_chapter_url(novel_slug, chapter_number)
-                    continue
-                
-                # Extract chapter data
-                chapter_data = self.extract_chapter_data(soup, chapter_number)
-                if not chapter_data:
-                    consecutive_failures += 1
-                    if consecutive_failures >= max_consecutive_failures:
-                        break
-                    chapter_number += 1
-                    current_url = self.build_chapter_url(novel_slug, chapter_number)
-                    continue
-                
-                # Save chapter
-                if self.save_chapter(novel_id, chapter_data):
-                    chapters_scraped += 1
-                    word_count = len(chapter_data.get('content', '').split())
-                    total_words += word_count
-                    consecutive_failures = 0  # Reset failure counter
-                    
-                    # Log progress every 10 chapters
-                    if chapters_scraped % 10 == 0:
-                        self.logger.info(f"Progress: {chapters_scraped} chapters scraped, {total_words:,} words")
-                else:
-                    consecutive_failures += 1
-                
-                # Get next chapter URL
-                next_url = self.get_next_chapter_url(soup, current_url)
-                if next_url:
-                    current_url = next_url
-                    # Extract chapter number from URL
-                    match = re.search(r'chapter-(\d+)', next_url)
-                    if match:
-                        chapter_number = int(match.group(1))
-                    else:
+                while not stop:
+                    # Collect the next batch of chapters, skipping ones already stored
+                    batch = []
+                    while len(batch) < self.concurrency and (not end_chapter or chapter_number <= end_chapter):
+                        if chapter_number in existing_chapters:
+                            # Jump over the whole run of stored chapters instead of one number per pass
+                            run_end = chapter_number
+                            while run_end + 1 in existing_chapters and (not end_chapter or run_end < end_chapter):
+                                run_end += 1
+                            if run_end == chapter_number:
+                                self.logger.info("Chapter %s already exists, skipping", chapter_number)
+                            else:
+                                self.logger.info("Chapters %s-%s already exist, skipping", chapter_number, run_end)
+                            chapter_number = run_end + 1
+                            continue
+                        elif (chapter_list_complete and first_listed <= chapter_number <= last_listed
+                              and chapter_number not in chapter_urls):
+                            unlisted_skipped += 1  # Missing from the full table of contents, so nothing to fetch
+                        else:
+                            batch.append(chapter_number)
                         chapter_number += 1
-                else:
-                    # Try building next chapter URL
-                    chapter_number += 1
-                    current_url = self.build_chapter_url(novel_slug, chapter_number)
-                
-                # Delay between requests
-                time.sleep(2.0)  # Be respectful to the server
-                
-            except Exception as e:
-                self.logger.error(f"Error processing chapter {chapter_number}: {e}")
-                consecutive_failures += 1
-                if consecutive_failures >= max_consecutive_failures:
-                    break
-                chapter_number += 1
-                current_url = self.build_chapter_url(novel_slug, chapter_number)
+                    
+                    # Start downloading it before the previous batch is processed, so parsing
+                    # and saving one batch overlaps the network wait for the next
+                    submitted = []
+                    if batch:
+                        # Delay between batches, adapted to how the server is coping
+                        delay = self._delay - (time.monotonic() - last_submit)
+                        if delay > 0:
+                            time.sleep(delay)  # Be respectful to the server
+                        last_submit = time.monotonic()
+                        for number in batch:
+                            url = chapter_urls.get(number) or url_prefix + str(number) + '/'
+                            submitted.append((number, url, executor.submit(
+                                self.fetch_chapter_page, url, novel_slug, number)))
+                    
+                    current, pending = pending, submitted
+                    if not current:
+                        if not pending:
+                            break
+                        continue
+                    
+                    # Process the finished batch in chapter order
+                    for number, url, future in current:
+                        last_attempted = number
+                        try:
+                            page = future.result()
+                            if page is None and next_number == number and next_url != url:
+                                # The previous chapter links here under a different URL
+                                url = next_url
+                                page = self.fetch_chapter_page(url, novel_slug, number)
+                            
+                            chapter_data = self.extract_chapter_data(page, number) if page is not None else None
+                            if not chapter_data:
+                                # Numbers the previous chapter's next link skipped over are expected to be missing
+                                if page is None and next_number is not None and number < next_number:
+                                    continue
+                                consecutive_failures += 1
+                                if consecutive_failures >= max_consecutive_failures:
+                                    self.logger.error("Too many consecutive failures, stopping")
+                                    stop = True
+                                    break
+                                continue
+                            
+                            # Save chapter
+                            if self.save_chapter(novel_id, chapter_data):
+                                existing_chapters.add(number)
+                                # A failed batch stays queued and is retried with the next chapter
+                                if len(self._pending_chapters) >= self.chapter_batch_size and not self.flush_chapters():
+                                    consecutive_failures += 1
+                                    if consecutive_failures >= max_consecutive_failures:
+                                        self.logger.error("Too many consecutive failures, stopping")
+                                        stop = True
+                                        break
+                                else:
+                                    consecutive_failures = 0  # Reset failure counter
+                                    if not self._pending_chapters:
+                                        self.logger.info("Progress: %d chapters scraped, %s words",
+                                                         self._saved_chapters, format(self._saved_words, ','))
+                            else:
+                                consecutive_failures += 1
+                            
+                            # Remember where this chapter's next link points
+                            next_url = self.get_next_chapter_url(page.tree, url)
+                            next_number = self.chapter_number_from_url(next_url) if next_url else None
+                            
+                        except Exception as e:
+                            self.logger.error("Error processing chapter %s: %s", number, e)
+                            consecutive_failures += 1
+                            if consecutive_failures >= max_consecutive_failures:
+                                stop = True
+                                break
+                    
+                    # Every fetch of the batch has finished, so adapt the delay once for all of them
+                    self.adjust_delay()
+                    
+                    # Follow the next link past a gap, dropping prefetched chapters inside it
+                    if not stop and next_number is not None and next_number > current[-1][0] + 1:
+                        for number, url, future in pending:
+                            if number < next_number:
+                                future.cancel()
+                        pending = [entry for entry in pending if entry[0] >= next_number]
+                        chapter_number = max(chapter_number, next_number)
+            finally:
+                # Don't wait on downloads that will never be processed
+                for number, url, future in pending:
+                    future.cancel()
+        
+        # Write whatever is left in the buffer; anything still queued after that was never stored
+        self.flush_chapters()
+        all_saved = not self._pending_chapters
         
-        self.logger.info(f"Chapter scraping completed!")
-        self.logger.info(f"   Chapters scraped: {chapters_scraped}")
-        self.logger.info(f"   Total words: {total_words:,}")
-        self.logger.info(f"   Last chapter attempted: {chapter_number - 1}")
+        self.logger.info("Chapter scraping completed!")
+        self.logger.info("   Chapters scraped: %d", self._saved_chapters)
+        self.logger.info("   Total words: %s", format(self._saved_words, ','))
+        if not all_saved:
+            self.logger.error("   Chapters not saved: %d", len(self._pending_chapters))
+        self.logger.info("   Last chapter attempted: %s", last_attempted)
+        if unlisted_skipped:
+            self.logger.info("   Not in the chapter list, skipped: %d", unlisted_skipped)
+        
+        # The stored chapters plus the ones saved this run, when every stored one was loaded up front
+        # and no unlisted number was passed over; otherwise leave the total to a COUNT
+        return len(existing_chapters) if skip_existing and all_saved and not unlisted_skipped else None
     
     def scrape_novel(self, novel_slug: str, start_chapter: int = 1, 
                     end_chapter: Optional[int] = None, novel_only: bool = False,
                     skip_existing: bool = True):
         """Main scraping method."""
-        self.logger.info(f"Starting scrape for novel: {novel_slug}")
+        self.logger.info("Starting scrape for novel: %s", novel_slug)
         
-        # Connect to database
+        # Connect to database, reusing the connection left open by an earlier novel
         self.connect_database()
         
         # Scrape novel information
         novel_info = self.scrape_novel_info(novel_slug)
         if not novel_info:
-            self.logger.error(f"Failed to scrape novel info for: {novel_slug}")
+            self.logger.error("Failed to scrape novel info for: %s", novel_slug)
             return
         
         # Save/update novel in database
         novel_id = self.get_or_create_novel(novel_info)
         if not novel_id:
-            self.logger.error(f"Failed to save novel to database")
+            self.logger.error("Failed to save novel to database")
             return
         
         if novel_only:
-            self.logger.info(f"Novel-only mode: Novel info saved for {novel_info['title']}")
+            self.logger.info("Novel-only mode: Novel info saved for %s", novel_info['title'])
             return
         
-        # Scrape chapters
-        self.scrape_chapters(novel_slug, novel_id, start_chapter, end_chapter, skip_existing)
+        # Scrape chapters; the novel row was just written, so long ranges skip foreign key checks
+        bulk = end_chapter is not None and end_chapter - start_chapter >= _BULK_LOAD_MIN_CHAPTERS
+        if bulk:
+            self.set_bulk_load_mode(True)
+        try:
+            total_chapters = self.scrape_chapters(novel_slug, novel_id, start_chapter, end_chapter, skip_existing,
+                                                  novel_info.get('chapter_urls'),
+                                                  novel_info.get('chapter_list_complete', False))
+        finally:
+            # Keep buffered chapters even if scraping is interrupted
+            self.flush_chapters()
+            if bulk:
+                self.set_bulk_load_mode(False)
         
-        # Update total chapters count
-        cursor = self.db_connection.cursor()
+        # Update total chapters count, only counting rows when the scrape couldn't track it
         try:
-            cursor.execute("SELECT COUNT(*) FROM chapters WHERE novel_id = %s", (novel_id,))
-            total_chapters = cursor.fetchone()[0]
-            cursor.execute("UPDATE novels SET total_chapters = %s WHERE id = %s", (total_chapters, novel_id))
+            if total_chapters is None:
+                self.cursor.execute("SELECT COUNT(*) FROM chapters WHERE novel_id = %s", (novel_id,))
+                total_chapters = self.cursor.fetchone()[0]
+            self.cursor.execute("UPDATE novels SET total_chapters = %s WHERE id = %s", (total_chapters, novel_id))
             self.db_connection.commit()
-            self.logger.info(f"Updated total chapters count: {total_chapters}")
+            self.logger.info("Updated total chapters count: %s", total_chapters)
         except pymysql.Error as e:
-            self.logger.error(f"Error updating total chapters: {e}")
-        finally:
-            cursor.close()
-        
-        # Close database connection
+            self.logger.error("Error updating total chapters: %s", e)
+    
+    def close(self):
+        """Close the shared cursor, database connection and HTTP cache at the end of a run."""
+        if self.cursor:
+            self.cursor.close()
+            self.cursor = None
         if self.db_connection:
             self.db_connection.close()
+            self.db_connection = None
+        if self.http_cache is not None:
+            self.http_cache.close()
 
 
 def main():
@@ -817,7 +1159,8 @@ def main():
     parser.add_argument(
         '--novel-slug',
         required=True,
-        help='Novel slug (e.g., not-all-heroes-from-earth-are-bad)'
+        nargs='+',
+        help='Novel slug(s) (e.g., not-all-heroes-from-earth-are-bad), scraped in order over one connection'
     )
     parser.add_argument(
         '--start-chapter',
@@ -841,22 +1184,46 @@ def main():
         default=True,
         help='Skip chapters that already exist in database'
     )
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=50,
+        help='Chapters written per database transaction (default: 50)'
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=8,
+        help='Chapter pages fetched at the same time (default: 8)'
+    )
+    parser.add_argument(
+        '--no-http-cache',
+        dest='http_cache',
+        action='store_false',
+        help='Do not read or write the on-disk cache of novel info'
+    )
     
     args = parser.parse_args()
     
+    scraper = None
     try:
-        scraper = WuxiaworldSiteScraper()
-        scraper.scrape_novel(
-            novel_slug=args.novel_slug,
-            start_chapter=args.start_chapter,
-            end_chapter=args.end_chapter,
-            novel_only=args.novel_only,
-            skip_existing=args.skip_existing
-        )
+        scraper = WuxiaworldSiteScraper(concurrency=args.concurrency, batch_size=args.batch_size,
+                                        cache_dir=_HTTP_CACHE_DIR if args.http_cache else None)
+        for novel_slug in args.novel_slug:
+            scraper.scrape_novel(
+                novel_slug=novel_slug,
+                start_chapter=args.start_chapter,
+                end_chapter=args.end_chapter,
+                novel_only=args.novel_only,
+                skip_existing=args.skip_existing
+            )
         
     except Exception as e:
         logging.error(f"Scraper failed with error: {e}")
         raise
+    finally:
+        if scraper is not None:
+            scraper.close()
 
 
 if __name__ == "__main__":